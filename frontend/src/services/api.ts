@@ -86,7 +86,9 @@ export const careerGuidanceAPI = {
   // Suggest career goals
   suggestCareers: async (major: string, interests: string[] = []) => {
     const response = await api.post('/api/onboarding/suggest-careers', null, {
-      params: { major, interests }
+      params: { major, interests },
+      // Repeat the key (interests=a&interests=b) instead of axios' default interests[]=a
+      paramsSerializer: { indexes: null }
     })
     return response.data
   },
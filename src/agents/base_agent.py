@@ -53,6 +53,26 @@ class BaseAgent(ABC):
         )
         return response.get("content", "")
 
+    async def aget_llm_response(self, prompt: str, max_tokens: int = 1000, temperature: float = 0.7) -> str:
+        """
+        Get a response from the LLM without blocking the event loop.
+        Concurrent identical prompts are coalesced into a single Bedrock call.
+
+        Args:
+            prompt (str): The prompt to send to the LLM
+            max_tokens (int): Maximum number of tokens to generate
+            temperature (float): Temperature for generation (0.0-1.0)
+
+        Returns:
+            str: The LLM response text
+        """
+        response = await self.bedrock_service.invoke_model_async(
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        return response.get("content", "")
+
     def update_state(self, updates: Dict[str, Any]) -> None:
         """
         Update the agent's state
@@ -8,6 +8,10 @@ from src.core.llm.career_llm_service import career_llm_service
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long career matching waits for live job market data
+# before falling back to the built-in requirements
+JOB_MARKET_TIMEOUT_SECONDS = 60
+
 class CareerMatchingAgent(BaseAgent):
     """
     Agent responsible for taking user career goals, coordinating with other agents,
@@ -61,6 +65,7 @@ class CareerMatchingAgent(BaseAgent):
         job_market_data = await self._get_job_market_requirements(career_goal, location)
         
         # Step 2: Coordinate with Course Catalog Agent to get available courses
+        # (an in-memory read, so there is nothing to overlap with step 1)
         print("📚 Coordinating with Course Catalog Agent...")
         available_courses = await self._get_available_courses()
         
@@ -131,8 +136,14 @@ class CareerMatchingAgent(BaseAgent):
                 "location": location,
                 "limit": 2  # Optimized to only get top 2 jobs for efficiency
             }
-            job_data = await self.job_market_agent.process_request(job_request)
+            job_data = await asyncio.wait_for(
+                self.job_market_agent.process_request(job_request),
+                timeout=JOB_MARKET_TIMEOUT_SECONDS
+            )
             return job_data
+        except asyncio.TimeoutError:
+            print(f"⚠️ Job Market Agent timed out after {JOB_MARKET_TIMEOUT_SECONDS}s, using fallback data")
+            return self._get_fallback_job_requirements(career_goal)
         except Exception as e:
             print(f"❌ Error coordinating with Job Market Agent: {e}")
             return self._get_fallback_job_requirements(career_goal)
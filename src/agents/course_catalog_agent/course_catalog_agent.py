@@ -1,12 +1,8 @@
 from typing import Dict, Any, List
-import json
+import orjson
 import os
 from datetime import datetime
 from src.agents.base_agent import BaseAgent
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 class CourseCatalogAgent(BaseAgent):
     """
@@ -76,8 +72,8 @@ class CourseCatalogAgent(BaseAgent):
             return []
         
         try:
-            with open(self.courses_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.courses_file, 'rb') as f:
+                data = orjson.loads(f.read())
                 courses = data.get('courses', [])
                 print(f"Loaded {len(courses)} courses from {self.courses_file}")
                 return courses
@@ -4,11 +4,6 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 from src.agents.base_agent import BaseAgent
-from src.scrapers.linkedin_selenium_scraper import LinkedInSeleniumScraper
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 class JobMarketAgent(BaseAgent):
     """
@@ -23,13 +18,22 @@ class JobMarketAgent(BaseAgent):
             description="Scrapes and analyzes job postings to extract skills, requirements, and trends"
         )
         
-        # Initialize LinkedIn Selenium scraper (primary and only scraper)
-        self.linkedin_selenium_scraper = LinkedInSeleniumScraper()
+        # LinkedIn Selenium scraper (primary and only scraper), created on first use
+        self._linkedin_selenium_scraper = None
         
         # Cache directory
         self.cache_dir = "data/job_cache"
         os.makedirs(self.cache_dir, exist_ok=True)
 
+    @property
+    def linkedin_selenium_scraper(self):
+        """LinkedIn Selenium scraper, imported and built lazily so Selenium isn't
+        loaded at startup when no scraping happens"""
+        if self._linkedin_selenium_scraper is None:
+            from src.scrapers.linkedin_selenium_scraper import LinkedInSeleniumScraper
+            self._linkedin_selenium_scraper = LinkedInSeleniumScraper()
+        return self._linkedin_selenium_scraper
+
     async def process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process a job market data request
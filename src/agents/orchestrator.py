@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, Any, List
 
 from src.agents.job_market_agent.job_market_agent import JobMarketAgent
@@ -40,9 +41,11 @@ class AgentOrchestrator:
         elif request_type == "job_market_analysis":
             return await self._process_job_market_request(request)
         elif request_type == "course_search":
-            return self._process_course_search_request(request)
+            # Course catalog lookups are synchronous (scraper/file IO), so keep
+            # them off the event loop
+            return await asyncio.to_thread(self._process_course_search_request, request)
         elif request_type == "get_all_courses":
-            return self._process_get_all_courses_request(request)
+            return await asyncio.to_thread(self._process_get_all_courses_request, request)
         elif request_type == "project_recommendations":
             return await self._process_project_request(request)
         else:
@@ -95,7 +95,7 @@ class ProjectAdvisorAgent:
             )
             
             # Parse LLM response
-            projects = self._parse_project_response(response)
+            projects = self._parse_project_response(response.get("content", ""))
             
             if projects:
                 print(f"✅ Generated {len(projects)} LLM-powered project recommendations")
@@ -1,51 +1,206 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Annotated, List, Dict, Any, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
 import uvicorn
+import logging
 import os
+import time
 from pathlib import Path
+import orjson
+from src.config.logging_config import setup_logging
 from src.agents.orchestrator import AgentOrchestrator
 from src.auth.linkedin_auth import require_linkedin_auth, linkedin_auth
 from src.api.user_onboarding import (
     ComprehensiveUserProfile, QuickStartProfile, UserOnboardingService,
-    CAREER_GOALS, SKILL_OPTIONS, DEPARTMENT_OPTIONS, INDUSTRY_OPTIONS
+    CAREER_GOALS, SKILL_OPTIONS, DEPARTMENT_OPTIONS, INDUSTRY_OPTIONS,
+    ACADEMIC_YEAR_OPTIONS, EXPERIENCE_LEVEL_OPTIONS, LEARNING_STYLE_OPTIONS,
+    TIME_COMMITMENT_OPTIONS, COMPANY_SIZE_OPTIONS
 )
 
+# Send log output through a background listener before the agents start logging
+setup_logging()
+logger = logging.getLogger(__name__)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson; unknown types fall back to str()"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str)
+
+class PydanticResponse(JSONResponse):
+    """JSON response serialized straight from a Pydantic model, skipping jsonable_encoder"""
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json(exclude_none=True).encode()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="UTD Career Guidance AI System",
     description="Autonomous agent system for data-driven career guidance",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
+# Explicit origins: a "*" wildcard alongside allow_credentials is rejected by
+# browsers anyway. Extra origins (e.g. a new CloudFront domain) can be supplied
+# as a comma-separated CORS_ORIGINS environment variable.
+CORS_ORIGINS = [
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+    "https://d20l3dy3iic6s3.cloudfront.net",  # Production CloudFront deployment
+] + [origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://127.0.0.1:3000",
-        "http://localhost:5173",
-        "http://127.0.0.1:5173",
-        "*"  # Allow all origins for production CloudFront deployment
-    ],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
+@app.exception_handler(Exception)
+async def handle_unexpected_error(request: Request, exc: Exception):
+    """
+    Turn any unhandled error into a structured 500 response
+
+    HTTPExceptions raised by handlers keep FastAPI's own handling; everything
+    else lands here instead of each endpoint wrapping itself in try/except.
+    The error itself is only logged, clients get a generic message.
+    """
+    logger.exception("Error processing %s %s", request.method, request.url.path, exc_info=exc)
+    response = ORJSONResponse({"detail": "Internal server error"}, status_code=500)
+
+    # This handler runs in ServerErrorMiddleware, outside CORSMiddleware, so
+    # allowed cross-origin callers need the CORS headers added here
+    origin = request.headers.get("origin")
+    if origin in CORS_ORIGINS:
+        response.headers["Access-Control-Allow-Origin"] = origin
+        response.headers["Access-Control-Allow-Credentials"] = "true"
+        response.headers["Vary"] = "Origin"
+    return response
+
 # Initialize agent orchestrator
 orchestrator = AgentOrchestrator()
 
 # Initialize user onboarding service
 onboarding_service = UserOnboardingService()
 
-# Serve static frontend files if they exist (for integrated deployment)
-frontend_dist_path = Path(__file__).parent.parent.parent / "frontend_dist"
-if frontend_dist_path.exists() and frontend_dist_path.is_dir():
-    app.mount("/assets", StaticFiles(directory=str(frontend_dist_path / "assets")), name="assets")
+@lru_cache(maxsize=1)
+def _iso_timestamp(epoch_second: int) -> str:
+    """Format a whole epoch second as an ISO-8601 UTC timestamp"""
+    return datetime.fromtimestamp(epoch_second, timezone.utc).isoformat()
+
+def _timestamped_json(payload: Dict[str, Any]):
+    """
+    Build a renderer for a static JSON payload that also carries the current
+    UTC timestamp. The payload is serialized once; each second only the
+    timestamp is formatted and spliced onto the end of the cached bytes.
+    """
+    # '{"a":1}' -> '{"a":1,"timestamp":"' (payload must be non-empty)
+    prefix = orjson.dumps(payload)[:-1] + b',"timestamp":"'
+
+    @lru_cache(maxsize=1)
+    def render(epoch_second: int) -> bytes:
+        return prefix + _iso_timestamp(epoch_second).encode() + b'"}'
+
+    return lambda: render(int(time.time()))
+
+# Pre-serialized responses for static endpoints
+_render_root = _timestamped_json({
+    "service": "UTD Career Guidance AI",
+    "status": "operational",
+    "version": "1.0.0",
+    "linkedin_auth_required": True,
+    "endpoints": [
+        # Authentication
+        "/auth/linkedin",
+        "/auth/status", 
+        "/auth/logout",
+        
+        # Career Guidance
+        "/api/career-guidance",
+        "/api/onboarding/quick-start",
+        "/api/onboarding/comprehensive",
+        "/api/onboarding/options",
+        "/api/onboarding/suggest-careers",
+        "/api/onboarding/validate-profile",
+        "/api/onboarding/smart-questions/{career_goal}",
+        
+        # Job Market & Courses
+        "/job-market",
+        "/course-search",
+        "/api/courses/all",
+        
+        # Projects & Agents
+        "/api/project-recommendations",
+        "/api/agents/status",
+        "/agent-capabilities",
+        
+        # System
+        "/health",
+        "/api/stats",
+        "/docs",
+        "/redoc",
+        "/openapi.json"
+    ]
+})
+
+_render_health = _timestamped_json({
+    "status": "healthy",
+    "bedrock": "connected"
+})
+
+_render_agent_status = _timestamped_json({
+    "career_matching_agent": "operational",
+    "job_market_agent": "operational",
+    "course_catalog_agent": "operational",
+    "project_advisor_agent": "operational"
+})
+
+_ONBOARDING_OPTIONS_JSON = orjson.dumps({
+    "career_goals": CAREER_GOALS,
+    "skills": SKILL_OPTIONS,
+    "departments": DEPARTMENT_OPTIONS,
+    "industries": INDUSTRY_OPTIONS,
+    "academic_years": ACADEMIC_YEAR_OPTIONS,
+    "experience_levels": EXPERIENCE_LEVEL_OPTIONS,
+    "learning_styles": LEARNING_STYLE_OPTIONS,
+    "time_commitments": TIME_COMMITMENT_OPTIONS,
+    "company_sizes": COMPANY_SIZE_OPTIONS
+})
+
+# In production, fetch from DynamoDB
+_SYSTEM_STATS_JSON = orjson.dumps({
+    "total_queries_processed": 0,
+    "total_jobs_scraped": 0,
+    "total_courses_analyzed": 0,
+    "avg_response_time_seconds": 0,
+    "last_job_scrape": None,
+    "last_catalog_update": None
+})
+
+# Agent capabilities can change with the agents, so the cached bytes expire
+# after a short TTL instead of being built once at import. Each uvicorn worker
+# keeps its own copy; workers may differ by at most one TTL, so no shared
+# cache (Redis) is needed.
+AGENT_CAPABILITIES_TTL_SECONDS = 30
+
+@lru_cache(maxsize=1)
+def _agent_capabilities_json(ttl_bucket: int) -> bytes:
+    """Serialized agent capabilities, rebuilt once per TTL window"""
+    return orjson.dumps(orchestrator.get_agent_capabilities())
 
 # Define request models
 class CareerQueryRequest(BaseModel):
@@ -74,11 +229,23 @@ class CourseSearchRequest(BaseModel):
     skill: Optional[str] = None
 
 class ProjectRecommendationRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+
     career_goal: str
-    current_skills: Optional[List[str]] = []
-    target_skills: Optional[List[str]] = []
-    skill_level: Optional[str] = "intermediate"
-    recommended_courses: Optional[List[Dict[str, Any]]] = []
+    current_skills: List[str] = Field(default_factory=list)
+    target_skills: List[str] = Field(default_factory=list)
+    skill_level: str = "intermediate"
+    recommended_courses: List[Dict[str, Any]] = Field(default_factory=list)
+
+    @field_validator("career_goal")
+    @classmethod
+    def career_goal_not_empty(cls, value: str) -> str:
+        if not value:
+            raise ValueError(
+                "career_goal is required and cannot be empty. Please provide a valid career goal "
+                "like 'Data Scientist', 'Software Engineer', etc."
+            )
+        return value
 
 class ProjectRequest(BaseModel):
     career_goal: str
@@ -87,103 +254,72 @@ class ProjectRequest(BaseModel):
     courses: Optional[List[Dict[str, Any]]] = []
     experience_level: Optional[str] = "beginner"
 
+async def require_authenticated_linkedin():
+    """
+    Dependency guarding endpoints that need real LinkedIn job market data
+
+    The session check reads the saved session file, so it runs in the threadpool
+    rather than on the event loop.
+    """
+    if not await run_in_threadpool(linkedin_auth.is_authenticated):
+        raise HTTPException(
+            status_code=401,
+            detail="LinkedIn authentication required. Please authenticate first using /auth/linkedin"
+        )
+
 # API endpoints
 @app.get("/")
 async def root():
     """Welcome to the UTD Career Guidance AI System API"""
-    return {
-        "service": "UTD Career Guidance AI",
-        "status": "operational",
-        "version": "1.0.0",
-        "linkedin_auth_required": True,
-        "timestamp": datetime.utcnow().isoformat(),
-        "endpoints": [
-            # Authentication
-            "/auth/linkedin",
-            "/auth/status", 
-            "/auth/logout",
-            
-            # Career Guidance
-            "/api/career-guidance",
-            "/api/onboarding/quick-start",
-            "/api/onboarding/comprehensive",
-            "/api/onboarding/options",
-            "/api/onboarding/suggest-careers",
-            "/api/onboarding/validate-profile",
-            "/api/onboarding/smart-questions/{career_goal}",
-            
-            # Job Market & Courses
-            "/job-market",
-            "/course-search",
-            "/api/courses/all",
-            
-            # Projects & Agents
-            "/api/project-recommendations",
-            "/api/agents/status",
-            "/agent-capabilities",
-            
-            # System
-            "/health",
-            "/api/stats",
-            "/docs",
-            "/redoc",
-            "/openapi.json"
-        ]
-    }
+    return Response(content=_render_root(), media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring"""
-    return {
-        "status": "healthy",
-        "bedrock": "connected",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return Response(content=_render_health(), media_type="application/json")
 
 # Authentication endpoints
-@app.post("/auth/linkedin")
+auth_router = APIRouter(prefix="/auth", tags=["auth"])
+
+@auth_router.post("/linkedin")
 async def authenticate_linkedin():
     """Authenticate with LinkedIn - required before using the system"""
-    try:
-        success = await require_linkedin_auth()
-        if success:
-            return {
-                "success": True,
-                "message": "LinkedIn authentication successful",
-                "status": "authenticated"
-            }
-        else:
-            return {
-                "success": False,
-                "message": "LinkedIn authentication failed",
-                "status": "not_authenticated"
-            }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Authentication error: {str(e)}")
-
-@app.get("/auth/status")
+    success = await require_linkedin_auth()
+    if success:
+        return {
+            "success": True,
+            "message": "LinkedIn authentication successful",
+            "status": "authenticated"
+        }
+    else:
+        return {
+            "success": False,
+            "message": "LinkedIn authentication failed",
+            "status": "not_authenticated"
+        }
+
+@auth_router.get("/status")
 async def get_auth_status():
     """Get current LinkedIn authentication status"""
-    try:
-        status = linkedin_auth.get_auth_status()
-        return status
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Status check error: {str(e)}")
+    status = linkedin_auth.get_auth_status()
+    return status
 
-@app.post("/auth/logout")
+@auth_router.post("/logout")
 async def logout_linkedin():
     """Logout and clear LinkedIn session"""
-    try:
-        success = linkedin_auth.logout()
-        return {
-            "success": success,
-            "message": "LinkedIn session cleared" if success else "Logout failed"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Logout error: {str(e)}")
+    success = linkedin_auth.logout()
+    return {
+        "success": success,
+        "message": "LinkedIn session cleared" if success else "Logout failed"
+    }
+
+app.include_router(auth_router)
 
-@app.post("/api/career-guidance", response_model=CareerQueryResponse)
-async def get_career_guidance(request: CareerQueryRequest):
+@app.post("/api/career-guidance", responses={200: {"model": CareerQueryResponse}})
+async def get_career_guidance(
+    request: CareerQueryRequest,
+    _auth: None = Depends(require_authenticated_linkedin)
+):
     """
     Main endpoint: Process career query and return guidance.
     Requires LinkedIn authentication for real job market data.
@@ -194,92 +330,68 @@ async def get_career_guidance(request: CareerQueryRequest):
         "location": "Dallas, TX"
     }
     """
-    # Check LinkedIn authentication first
-    if not linkedin_auth.is_authenticated():
-        raise HTTPException(
-            status_code=401, 
-            detail="LinkedIn authentication required. Please authenticate first using /auth/linkedin"
-        )
+    start_time = time.perf_counter()
     
-    start_time = datetime.utcnow()
+    # Call orchestrator agent
+    result = await orchestrator.process_request({
+        "request_type": "career_advice",
+        "career_goal": request.query,
+        "location": request.location
+    })
     
-    try:
-        # Call orchestrator agent
-        result = await orchestrator.process_request({
-            "request_type": "career_advice",
-            "career_goal": request.query,
-            "location": request.location
-        })
-        
-        # Calculate processing time
-        end_time = datetime.utcnow()
-        processing_time = (end_time - start_time).total_seconds()
-        
-        return CareerQueryResponse(
-            success=True,
-            career_goal=result.get('career_goal'),
-            job_market=result.get('job_market_analysis'),
-            course_recommendations=result.get('course_recommendations'),
-            insights=result.get('learning_path'),
-            next_steps=result.get('project_recommendations'),
-            processing_time_seconds=round(processing_time, 2)
-        )
-        
-    except Exception as e:
-        print(f"Error processing query: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to process career query: {str(e)}"
-        )
+    # Calculate processing time
+    processing_time = time.perf_counter() - start_time
+    
+    # Built from trusted orchestrator output, so skip validation on the way out
+    return PydanticResponse(CareerQueryResponse.model_construct(
+        success=True,
+        career_goal=result.get('career_goal'),
+        job_market=result.get('job_market_analysis'),
+        course_recommendations=result.get('course_recommendations'),
+        insights=result.get('learning_path'),
+        next_steps=result.get('project_recommendations'),
+        processing_time_seconds=round(processing_time, 2)
+    ))
 
 
 @app.post("/job-market")
-async def get_job_market_analysis(request: JobMarketRequest):
+async def get_job_market_analysis(
+    request: JobMarketRequest,
+    _auth: None = Depends(require_authenticated_linkedin)
+):
     """Get job market analysis for a specific job title - requires LinkedIn authentication"""
-    # Check LinkedIn authentication first
-    if not linkedin_auth.is_authenticated():
-        raise HTTPException(
-            status_code=401, 
-            detail="LinkedIn authentication required for real job market data. Please authenticate first using /auth/linkedin"
-        )
-    
-    try:
-        orchestrator_request = {
-            "request_type": "job_market_analysis",
-            **request.dict()
-        }
-        response = await orchestrator.process_request(orchestrator_request)
-        return response
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing request: {str(e)}")
+    orchestrator_request = {
+        "request_type": "job_market_analysis",
+        "job_title": request.job_title,
+        "location": request.location,
+        "limit": request.limit
+    }
+    response = await orchestrator.process_request(orchestrator_request)
+    return response
 
 @app.post("/course-search")
 async def search_courses(request: CourseSearchRequest):
     """Search for UTD courses by term, department, or skill"""
-    try:
-        if not request.search_term and not request.department and not request.skill:
-            raise HTTPException(status_code=400, detail="At least one search parameter is required")
-
-        orchestrator_request = {
-            "request_type": "course_search",
-            **request.dict()
-        }
-        response = await orchestrator.process_request(orchestrator_request)
-        return response
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing request: {str(e)}")
+    if not request.search_term and not request.department and not request.skill:
+        raise HTTPException(status_code=400, detail="At least one search parameter is required")
+
+    orchestrator_request = {
+        "request_type": "course_search",
+        "search_term": request.search_term,
+        "department": request.department,
+        "skill": request.skill
+    }
+    response = await orchestrator.process_request(orchestrator_request)
+    return response
 
 @app.get("/api/courses/all")
 async def get_all_courses():
     """Get all available UTD courses from the catalog"""
-    try:
-        orchestrator_request = {
-            "request_type": "get_all_courses"
-        }
-        response = await orchestrator.process_request(orchestrator_request)
-        return response
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching courses: {str(e)}")
+    orchestrator_request = {
+        "request_type": "get_all_courses"
+    }
+    response = await orchestrator.process_request(orchestrator_request)
+    return response
 
 @app.post("/api/project-recommendations")
 async def get_project_recommendations(request: ProjectRecommendationRequest):
@@ -304,71 +416,43 @@ async def get_project_recommendations(request: ProjectRecommendationRequest):
     }
     ```
     """
-    try:
-        # Validate required fields
-        if not request.career_goal or not request.career_goal.strip():
-            raise HTTPException(
-                status_code=400, 
-                detail="career_goal is required and cannot be empty. Please provide a valid career goal like 'Data Scientist', 'Software Engineer', etc."
-            )
-        
-        # Ensure lists are not None
-        current_skills = request.current_skills or []
-        target_skills = request.target_skills or []
-        recommended_courses = request.recommended_courses or []
-        
-        orchestrator_request = {
-            "request_type": "project_recommendations",
-            "career_goal": request.career_goal.strip(),
-            "current_skills": current_skills,
-            "target_skills": target_skills,
-            "skill_level": request.skill_level or "intermediate",
-            "recommended_courses": recommended_courses
-        }
-        
-        result = await orchestrator.process_request(orchestrator_request)
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating project recommendations: {str(e)}")
+    orchestrator_request = {
+        "request_type": "project_recommendations",
+        "career_goal": request.career_goal,
+        "current_skills": request.current_skills,
+        "target_skills": request.target_skills,
+        "skill_level": request.skill_level,
+        "recommended_courses": request.recommended_courses
+    }
+    
+    result = await orchestrator.process_request(orchestrator_request)
+    return result
 
 @app.get("/api/agents/status")
 async def get_agent_status():
     """Check status of all agents"""
-    return {
-        "career_matching_agent": "operational",
-        "job_market_agent": "operational", 
-        "course_catalog_agent": "operational",
-        "project_advisor_agent": "operational",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return Response(content=_render_agent_status(), media_type="application/json")
 
 # =============================================================================
 # STREAMLINED USER ONBOARDING ENDPOINTS
 # =============================================================================
 
-@app.get("/api/onboarding/options")
+onboarding_router = APIRouter(
+    prefix="/api/onboarding",
+    tags=["onboarding"],
+    default_response_class=ORJSONResponse
+)
+
+@onboarding_router.get("/options")
 async def get_onboarding_options():
     """
     Get all available options for user onboarding forms
     
     Returns predefined options for dropdowns, multi-selects, etc.
     """
-    return {
-        "career_goals": CAREER_GOALS,
-        "skills": SKILL_OPTIONS,
-        "departments": DEPARTMENT_OPTIONS,
-        "industries": INDUSTRY_OPTIONS,
-        "academic_years": ["freshman", "sophomore", "junior", "senior", "graduate"],
-        "experience_levels": ["beginner", "intermediate", "advanced"],
-        "learning_styles": ["hands-on", "theoretical", "mixed", "project-based"],
-        "time_commitments": ["light", "moderate", "intensive"],
-        "company_sizes": ["startup", "mid-size", "large", "enterprise"]
-    }
+    return Response(content=_ONBOARDING_OPTIONS_JSON, media_type="application/json")
 
-@app.post("/api/onboarding/quick-start")
+@onboarding_router.post("/quick-start")
 async def quick_start_career_guidance(profile: QuickStartProfile):
     """
     Quick start career guidance with minimal information
@@ -379,154 +463,156 @@ async def quick_start_career_guidance(profile: QuickStartProfile):
     - Academic year (optional)
     - Location (optional)
     """
-    try:
-        # Convert quick start profile to full career advice request
-        career_request = {
-            "request_type": "career_advice",
-            "career_goal": profile.career_goal,
-            "location": profile.location,
-            "current_skills": profile.current_skills,
-            "completed_courses": [],  # Will be inferred
-            "experience_level": "intermediate"  # Default
-        }
-        
-        # Get comprehensive career guidance
-        result = await orchestrator.process_request(career_request)
-        
-        # Add quick start context
-        result["quick_start"] = True
-        result["profile_completeness"] = "minimal"
-        result["next_steps"] = [
-            "Review your personalized course recommendations",
-            "Check the job market insights for your career goal",
-            "Consider completing your profile for more personalized advice"
-        ]
-        
-        return result
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Quick start failed: {str(e)}")
+    # Convert quick start profile to full career advice request
+    career_request = {
+        "request_type": "career_advice",
+        "career_goal": profile.career_goal,
+        "location": profile.location,
+        "current_skills": profile.current_skills,
+        "completed_courses": [],  # Will be inferred
+        "experience_level": "intermediate"  # Default
+    }
+    
+    # Get comprehensive career guidance
+    result = await orchestrator.process_request(career_request)
+    
+    # Add quick start context
+    result["quick_start"] = True
+    result["profile_completeness"] = "minimal"
+    result["next_steps"] = [
+        "Review your personalized course recommendations",
+        "Check the job market insights for your career goal",
+        "Consider completing your profile for more personalized advice"
+    ]
+    
+    return result
 
-@app.post("/api/onboarding/comprehensive")
+@onboarding_router.post("/comprehensive")
 async def comprehensive_career_guidance(profile: ComprehensiveUserProfile):
     """
     Comprehensive career guidance with full user profile
     
     Uses all available information for highly personalized recommendations
     """
-    try:
-        # Validate profile completeness
-        validation = onboarding_service.validate_profile(profile)
-        
-        # Convert comprehensive profile to career advice request
-        career_request = {
-            "request_type": "career_advice",
-            "career_goal": profile.career_goal,
-            "location": profile.preferred_location,
-            "current_skills": profile.current_skills,
-            "completed_courses": profile.completed_courses,
-            "experience_level": profile.skill_level.value
-        }
-        
-        # Get comprehensive career guidance
-        result = await orchestrator.process_request(career_request)
-        
-        # Add comprehensive context and validation results
-        result["profile_validation"] = validation.dict()
-        result["comprehensive"] = True
-        result["personalization_level"] = "high"
-        
-        # Add smart follow-up questions if profile is incomplete
-        if not validation.is_valid or validation.completeness_score < 80:
-            result["smart_questions"] = onboarding_service.generate_smart_questions(profile)
-        
-        return result
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Comprehensive guidance failed: {str(e)}")
-
-@app.post("/api/onboarding/suggest-careers")
-async def suggest_career_goals(major: str, interests: List[str] = []):
+    # Validate profile completeness
+    validation = onboarding_service.validate_profile(profile)
+    
+    # Convert comprehensive profile to career advice request
+    career_request = {
+        "request_type": "career_advice",
+        "career_goal": profile.career_goal,
+        "location": profile.preferred_location,
+        "current_skills": profile.current_skills,
+        "completed_courses": profile.completed_courses,
+        "experience_level": profile.skill_level.value
+    }
+    
+    # Get comprehensive career guidance
+    result = await orchestrator.process_request(career_request)
+    
+    # Add comprehensive context and validation results
+    result["profile_validation"] = validation
+    result["comprehensive"] = True
+    result["personalization_level"] = "high"
+    
+    # Add smart follow-up questions if profile is incomplete
+    if not validation.is_valid or validation.completeness_score < 80:
+        result["smart_questions"] = onboarding_service.generate_smart_questions(profile)
+    
+    return ORJSONResponse(result)
+
+@lru_cache(maxsize=512)
+def _smart_questions_json(career_goal: str) -> bytes:
+    """Serialized smart questions for a bare career-goal profile, cached per goal"""
+    # Minimal profile with just the career goal; the path parameter is already a
+    # plain string, so skip validation and let the field defaults fill the rest
+    profile = onboarding_service.load_trusted({"career_goal": career_goal})
+    questions = onboarding_service.generate_smart_questions(profile)
+    return orjson.dumps({
+        "career_goal": career_goal,
+        "questions": questions,
+        "total_questions": len(questions)
+    })
+
+@onboarding_router.post("/suggest-careers")
+async def suggest_career_goals(
+    major: Annotated[str, Query()],
+    interests: Annotated[List[str], Query()] = []
+):
     """
     Suggest career goals based on major and interests
     
     Helps users discover relevant career paths
     """
-    try:
-        suggestions = onboarding_service.suggest_career_goals(major, interests)
-        return {
-            "suggestions": suggestions,
-            "major": major,
-            "interests": interests,
-            "total_suggestions": len(suggestions)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Career suggestion failed: {str(e)}")
-
-@app.post("/api/onboarding/validate-profile")
+    # The lookup itself is cached by the service on normalized (major, interests)
+    suggestions = onboarding_service.suggest_career_goals(major, interests)
+    return ORJSONResponse({
+        "suggestions": suggestions,
+        "major": major,
+        "interests": interests,
+        "total_suggestions": len(suggestions)
+    })
+
+@onboarding_router.post("/validate-profile")
 async def validate_user_profile(profile: ComprehensiveUserProfile):
     """
     Validate user profile and get recommendations for improvement
     """
-    try:
-        validation = onboarding_service.validate_profile(profile)
-        return validation.dict()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Profile validation failed: {str(e)}")
+    validation = onboarding_service.validate_profile(profile)
+    # orjson serializes dataclasses natively
+    return ORJSONResponse(validation)
 
-@app.get("/api/onboarding/smart-questions/{career_goal}")
+@onboarding_router.get("/smart-questions/{career_goal}")
 async def get_smart_questions(career_goal: str):
     """
     Get smart follow-up questions based on career goal
     
     Helps guide users through profile completion
     """
-    try:
-        # Create a minimal profile with just the career goal
-        profile = ComprehensiveUserProfile(career_goal=career_goal)
-        questions = onboarding_service.generate_smart_questions(profile)
-        
-        return {
-            "career_goal": career_goal,
-            "questions": questions,
-            "total_questions": len(questions)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Smart questions failed: {str(e)}")
+    return Response(content=_smart_questions_json(career_goal), media_type="application/json")
+
+app.include_router(onboarding_router)
 
 @app.get("/api/stats")
 async def get_system_stats():
     """Get system statistics for demo"""
-    # In production, fetch from DynamoDB
-    return {
-        "total_queries_processed": 0,
-        "total_jobs_scraped": 0,
-        "total_courses_analyzed": 0,
-        "avg_response_time_seconds": 0,
-        "last_job_scrape": None,
-        "last_catalog_update": None
-    }
+    return Response(content=_SYSTEM_STATS_JSON, media_type="application/json")
 
 @app.get("/agent-capabilities")
 async def get_agent_capabilities():
     """Get capabilities of all agents in the system"""
-    return orchestrator.get_agent_capabilities()
-
-# Serve frontend index.html for integrated deployment
-@app.get("/{full_path:path}")
-async def serve_frontend(full_path: str):
-    """Serve the frontend application for integrated deployment"""
-    from fastapi.responses import FileResponse
-
-    frontend_dist_path = Path(__file__).parent.parent.parent / "frontend_dist"
-    if not frontend_dist_path.exists():
-        raise HTTPException(status_code=404, detail="Frontend not found")
-
-    # Serve index.html for all non-API routes (SPA routing)
-    index_path = frontend_dist_path / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
-    raise HTTPException(status_code=404, detail="Frontend index.html not found")
+    ttl_bucket = int(time.time()) // AGENT_CAPABILITIES_TTL_SECONDS
+    return Response(content=_agent_capabilities_json(ttl_bucket), media_type="application/json")
+
+class SPAStaticFiles(StaticFiles):
+    """Static files that fall back to index.html so client-side (SPA) routes resolve"""
+
+    async def get_response(self, path: str, scope):
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as exc:
+            # Missing files (anything with an extension) stay 404s
+            if exc.status_code != 404 or os.path.splitext(path)[1]:
+                raise
+            return await super().get_response("index.html", scope)
+
+# Serve the built frontend for integrated deployment. Mounted last so every
+# API route above takes precedence over the catch-all.
+frontend_dist_path = Path(__file__).parent.parent.parent / "frontend_dist"
+if frontend_dist_path.exists() and frontend_dist_path.is_dir():
+    app.mount("/", SPAStaticFiles(directory=str(frontend_dist_path), html=True), name="frontend")
 
 if __name__ == "__main__":
-    uvicorn.run("api.app:app", host="0.0.0.0", port=8000, reload=True)
+    # Production-style launch: one worker per core, on uvloop/httptools where
+    # installed ("auto" falls back to asyncio/h11, e.g. on Windows). For
+    # auto-reload during development use start_server.py instead.
+    uvicorn.run(
+        "src.api.app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="auto",
+        http="auto",
+        limit_concurrency=1000,
+        backlog=2048
+    )
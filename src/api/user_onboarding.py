@@ -3,10 +3,34 @@ User Onboarding Module
 Collects crucial information upfront for smooth user experience
 """
 
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Annotated, Dict, Any, FrozenSet, List, Optional, Tuple, Type, TypeVar
+from annotated_types import Ge, Le
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+def _has_validators(model_cls: Type[BaseModel]) -> bool:
+    """Whether a model defines custom field/model validators that must always run"""
+    decorators = model_cls.__pydantic_decorators__
+    return bool(decorators.field_validators or decorators.model_validators)
+
+def construct_trusted(model_cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """
+    Build a model from server-trusted data without re-running validation
+
+    Falls back to full validation as soon as the model gains a custom validator,
+    so adding one later can't be silently bypassed. Untrusted (HTTP) input should
+    keep going through normal model validation.
+    """
+    if _has_validators(model_cls):
+        return model_cls.model_validate(data)
+    return model_cls.model_construct(**data)
+
 class ExperienceLevel(str, Enum):
     BEGINNER = "beginner"
     INTERMEDIATE = "intermediate" 
@@ -24,10 +48,11 @@ class ComprehensiveUserProfile(BaseModel):
     Comprehensive user profile that collects all crucial information upfront
     for minimal interaction and smooth user experience
     """
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
     
     # Core Career Information
     career_goal: str = Field(..., description="Primary career goal (e.g., 'Data Scientist', 'Software Engineer')")
-    alternative_careers: Optional[List[str]] = Field(default=[], description="Alternative career interests")
+    alternative_careers: Optional[List[str]] = Field(default_factory=list, description="Alternative career interests")
     
     # Location & Market
     preferred_location: str = Field(default="Dallas, TX", description="Preferred job location")
@@ -37,27 +62,27 @@ class ComprehensiveUserProfile(BaseModel):
     academic_year: AcademicYear = Field(default=AcademicYear.SOPHOMORE, description="Current academic year")
     major: Optional[str] = Field(default=None, description="Primary major/field of study")
     minor: Optional[str] = Field(default=None, description="Minor or secondary field")
-    gpa: Optional[float] = Field(default=None, ge=0.0, le=4.0, description="Current GPA (optional)")
+    gpa: Optional[Annotated[float, Ge(0.0), Le(4.0)]] = Field(default=None, description="Current GPA (optional)")
     
     # Skills Assessment
-    current_skills: List[str] = Field(default=[], description="Skills you currently have")
-    target_skills: List[str] = Field(default=[], description="Skills you want to develop")
+    current_skills: List[str] = Field(default_factory=list, description="Skills you currently have")
+    target_skills: List[str] = Field(default_factory=list, description="Skills you want to develop")
     skill_level: ExperienceLevel = Field(default=ExperienceLevel.INTERMEDIATE, description="Overall skill level")
     
     # Course History
-    completed_courses: List[str] = Field(default=[], description="Courses you've already taken")
-    courses_in_progress: List[str] = Field(default=[], description="Courses you're currently taking")
-    preferred_departments: List[str] = Field(default=[], description="Departments you're interested in")
+    completed_courses: List[str] = Field(default_factory=list, description="Courses you've already taken")
+    courses_in_progress: List[str] = Field(default_factory=list, description="Courses you're currently taking")
+    preferred_departments: List[str] = Field(default_factory=list, description="Departments you're interested in")
     
     # Career Preferences
     salary_expectations: Optional[str] = Field(default=None, description="Salary range expectations")
     company_size_preference: Optional[str] = Field(default=None, description="Startup, mid-size, or large company preference")
-    industry_interests: List[str] = Field(default=[], description="Industries of interest")
+    industry_interests: List[str] = Field(default_factory=list, description="Industries of interest")
     
     # Learning Preferences
     learning_style: Optional[str] = Field(default="hands-on", description="Preferred learning style")
     time_commitment: Optional[str] = Field(default="moderate", description="Time available for skill development")
-    project_preferences: List[str] = Field(default=[], description="Types of projects you're interested in")
+    project_preferences: List[str] = Field(default_factory=list, description="Types of projects you're interested in")
     
     # Goals & Timeline
     graduation_timeline: Optional[str] = Field(default=None, description="Expected graduation timeline")
@@ -67,22 +92,31 @@ class ComprehensiveUserProfile(BaseModel):
     # Additional Context
     special_circumstances: Optional[str] = Field(default=None, description="Any special circumstances or constraints")
     previous_experience: Optional[str] = Field(default=None, description="Previous work/internship experience")
-    portfolio_items: List[str] = Field(default=[], description="Existing portfolio projects")
+    portfolio_items: List[str] = Field(default_factory=list, description="Existing portfolio projects")
 
 class QuickStartProfile(BaseModel):
     """
     Minimal profile for users who want to get started quickly
     """
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
     career_goal: str = Field(..., description="What career do you want to pursue?")
-    current_skills: List[str] = Field(default=[], description="What skills do you already have?")
+    current_skills: List[str] = Field(default_factory=list, description="What skills do you already have?")
     academic_year: AcademicYear = Field(default=AcademicYear.SOPHOMORE, description="What year are you?")
     location: str = Field(default="Dallas, TX", description="Where do you want to work?")
 
-class ProfileValidationResult(BaseModel):
-    """Result of profile validation"""
+# Fields that count toward profile completeness
+REQUIRED_CORE_FIELDS = ("career_goal",)
+RECOMMENDED_FIELDS = (
+    "current_skills", "target_skills", "academic_year",
+    "preferred_location", "completed_courses"
+)
+
+@dataclass(slots=True)
+class ProfileValidationResult:
+    """Result of profile validation (server-built output, so no Pydantic validation)"""
     is_valid: bool
-    missing_fields: List[str] = []
-    recommendations: List[str] = []
+    missing_fields: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
     completeness_score: float = 0.0
 
 class UserOnboardingService:
@@ -91,11 +125,9 @@ class UserOnboardingService:
     """
     
     def __init__(self):
-        self.required_core_fields = ["career_goal"]
-        self.recommended_fields = [
-            "current_skills", "target_skills", "academic_year", 
-            "preferred_location", "completed_courses"
-        ]
+        self.required_core_fields = REQUIRED_CORE_FIELDS
+        self.recommended_fields = RECOMMENDED_FIELDS
+        self.scored_fields = REQUIRED_CORE_FIELDS + RECOMMENDED_FIELDS
     
     def validate_profile(self, profile: ComprehensiveUserProfile) -> ProfileValidationResult:
         """
@@ -122,11 +154,12 @@ class UserOnboardingService:
             recommendations.append("Set your preferred work location for job market analysis")
         
         # Calculate completeness score
-        total_fields = len(self.required_core_fields) + len(self.recommended_fields)
-        filled_fields = len([f for f in self.required_core_fields if getattr(profile, f, None)])
-        filled_fields += len([f for f in self.recommended_fields if getattr(profile, f, None) and getattr(profile, f)])
+        # One pass over the scored fields, reading values straight from the
+        # model's __dict__. Defaults count as filled; empty values don't.
+        values = profile.__dict__
+        filled_fields = sum(1 for f in self.scored_fields if values.get(f))
         
-        completeness_score = (filled_fields / total_fields) * 100
+        completeness_score = (filled_fields / len(self.scored_fields)) * 100
         
         is_valid = len(missing_fields) == 0 and completeness_score >= 50
         
@@ -141,58 +174,51 @@ class UserOnboardingService:
         """
         Create a minimal profile for quick start
         """
-        return QuickStartProfile(
-            career_goal=career_goal,
-            current_skills=kwargs.get("current_skills", []),
-            academic_year=kwargs.get("academic_year", AcademicYear.SOPHOMORE),
-            location=kwargs.get("location", "Dallas, TX")
-        )
+        return construct_trusted(QuickStartProfile, {
+            "career_goal": career_goal,
+            "current_skills": kwargs.get("current_skills", []),
+            "academic_year": AcademicYear(kwargs.get("academic_year", AcademicYear.SOPHOMORE)),
+            "location": kwargs.get("location", "Dallas, TX")
+        })
+
+    def load_trusted(self, data: Dict[str, Any]) -> ComprehensiveUserProfile:
+        """
+        Load a profile from server-side storage (session/DB) without re-validating
+
+        Args:
+            data (Dict[str, Any]): Previously validated profile fields
+
+        Returns:
+            ComprehensiveUserProfile: Profile with unset fields filled from defaults
+        """
+        return construct_trusted(ComprehensiveUserProfile, data)
     
     def suggest_career_goals(self, major: str, interests: List[str]) -> List[str]:
         """
         Suggest career goals based on major and interests
         """
-        career_suggestions = {
-            "computer science": [
-                "Software Engineer", "Data Scientist", "DevOps Engineer", 
-                "Cybersecurity Analyst", "Product Manager", "Full Stack Developer"
-            ],
-            "data science": [
-                "Data Scientist", "Data Analyst", "Machine Learning Engineer",
-                "Business Intelligence Analyst", "Data Engineer", "Research Scientist"
-            ],
-            "business": [
-                "Business Analyst", "Product Manager", "Management Consultant",
-                "Investment Analyst", "Marketing Manager", "Operations Manager"
-            ],
-            "engineering": [
-                "Software Engineer", "Systems Engineer", "DevOps Engineer",
-                "Product Manager", "Technical Consultant", "Engineering Manager"
-            ],
-            "neuroscience": [
-                "Research Scientist", "Neurobiologist", "Data Scientist",
-                "Clinical Research Coordinator", "Biotech Analyst", "AI Researcher"
-            ]
-        }
-        
-        major_lower = major.lower()
+        interests_set = frozenset(interest.lower() for interest in interests)
+        return list(self._suggest(major.lower(), interests_set))
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _suggest(major_lower: str, interests_set: FrozenSet[str]) -> Tuple[str, ...]:
+        """Cached suggestion lookup on normalized (major, interests) inputs"""
         suggestions = []
         
-        for field, careers in career_suggestions.items():
-            if field in major_lower:
+        # One scan of the major text finds every trigger phrase it mentions
+        matched_fields = set(MAJOR_FIELD_PATTERN.findall(major_lower))
+        for field, careers in CAREER_SUGGESTIONS_BY_MAJOR.items():
+            if field in matched_fields:
                 suggestions.extend(careers)
         
         # Add general suggestions based on interests
-        if "data" in interests or "analytics" in interests:
-            suggestions.extend(["Data Scientist", "Data Analyst", "Business Intelligence Analyst"])
-        
-        if "software" in interests or "programming" in interests:
-            suggestions.extend(["Software Engineer", "Full Stack Developer", "DevOps Engineer"])
-        
-        if "business" in interests or "management" in interests:
-            suggestions.extend(["Product Manager", "Business Analyst", "Management Consultant"])
+        for keywords, careers in INTEREST_CAREER_SUGGESTIONS:
+            if not interests_set.isdisjoint(keywords):
+                suggestions.extend(careers)
         
-        return list(set(suggestions))[:8]  # Return top 8 unique suggestions
+        # dict.fromkeys dedupes while keeping first-seen order
+        return tuple(dict.fromkeys(suggestions))[:8]  # Return top 8 unique suggestions
     
     def generate_smart_questions(self, profile: ComprehensiveUserProfile) -> List[Dict[str, str]]:
         """
@@ -200,60 +226,108 @@ class UserOnboardingService:
         """
         questions = []
         
-        if not profile.current_skills:
-            questions.append({
-                "question": "What programming languages or technical skills do you already know?",
-                "field": "current_skills",
-                "type": "multi_select",
-                "options": ["Python", "Java", "JavaScript", "SQL", "R", "C++", "HTML/CSS", "Git", "Excel", "PowerBI"]
-            })
-        
-        if not profile.target_skills:
-            questions.append({
-                "question": "What skills do you want to develop for your career goal?",
-                "field": "target_skills", 
-                "type": "multi_select",
-                "options": ["Machine Learning", "Data Analysis", "Web Development", "Cloud Computing", "Project Management"]
-            })
-        
-        if not profile.completed_courses:
-            questions.append({
-                "question": "What UTD courses have you already taken?",
-                "field": "completed_courses",
-                "type": "search_select",
-                "placeholder": "Search for courses (e.g., CS 1337, MATH 2414)"
-            })
-        
-        if not profile.industry_interests:
-            questions.append({
-                "question": "What industries interest you?",
-                "field": "industry_interests",
-                "type": "multi_select",
-                "options": ["Technology", "Finance", "Healthcare", "Education", "Consulting", "Startups", "Government"]
-            })
+        # Ask about the first empty profile fields, in template order
+        for template in SMART_QUESTION_TEMPLATES:
+            if not getattr(profile, template["field"]):
+                questions.append(dict(template))
+                if len(questions) == MAX_SMART_QUESTIONS:
+                    break
         
-        return questions[:3]  # Limit to 3 questions to avoid overwhelming
+        return questions
 
-# Predefined options for form fields
-CAREER_GOALS = [
+# Predefined options for form fields (immutable; served as-is by the options endpoint)
+CAREER_GOALS = (
     "Data Scientist", "Software Engineer", "Product Manager", "Business Analyst",
     "DevOps Engineer", "Data Analyst", "Full Stack Developer", "Cybersecurity Analyst",
     "Machine Learning Engineer", "Investment Analyst", "Management Consultant",
     "Research Scientist", "Technical Consultant", "Operations Manager"
-]
+)
 
-SKILL_OPTIONS = [
+SKILL_OPTIONS = (
     "Python", "Java", "JavaScript", "SQL", "R", "C++", "HTML/CSS", "Git",
     "Machine Learning", "Data Analysis", "Web Development", "Cloud Computing",
     "Project Management", "Excel", "PowerBI", "Tableau", "Docker", "AWS"
-]
+)
 
-DEPARTMENT_OPTIONS = [
+DEPARTMENT_OPTIONS = (
     "Computer Science", "Data Science", "Business", "Engineering", "Mathematics",
     "Statistics", "Neuroscience", "Psychology", "Economics", "Finance"
-]
+)
 
-INDUSTRY_OPTIONS = [
+INDUSTRY_OPTIONS = (
     "Technology", "Finance", "Healthcare", "Education", "Consulting", 
     "Startups", "Government", "Non-profit", "Manufacturing", "Retail"
-]
+)
+
+ACADEMIC_YEAR_OPTIONS = tuple(year.value for year in AcademicYear)
+EXPERIENCE_LEVEL_OPTIONS = tuple(level.value for level in ExperienceLevel)
+LEARNING_STYLE_OPTIONS = ("hands-on", "theoretical", "mixed", "project-based")
+TIME_COMMITMENT_OPTIONS = ("light", "moderate", "intensive")
+COMPANY_SIZE_OPTIONS = ("startup", "mid-size", "large", "enterprise")
+
+# Career suggestions by (lowercase) major keyword, built once at import
+CAREER_SUGGESTIONS_BY_MAJOR = {
+    "computer science": (
+        "Software Engineer", "Data Scientist", "DevOps Engineer", 
+        "Cybersecurity Analyst", "Product Manager", "Full Stack Developer"
+    ),
+    "data science": (
+        "Data Scientist", "Data Analyst", "Machine Learning Engineer",
+        "Business Intelligence Analyst", "Data Engineer", "Research Scientist"
+    ),
+    "business": (
+        "Business Analyst", "Product Manager", "Management Consultant",
+        "Investment Analyst", "Marketing Manager", "Operations Manager"
+    ),
+    "engineering": (
+        "Software Engineer", "Systems Engineer", "DevOps Engineer",
+        "Product Manager", "Technical Consultant", "Engineering Manager"
+    ),
+    "neuroscience": (
+        "Research Scientist", "Neurobiologist", "Data Scientist",
+        "Clinical Research Coordinator", "Biotech Analyst", "AI Researcher"
+    )
+}
+
+# Alternation over every major keyword, longest first so overlapping phrases
+# resolve to the most specific one
+MAJOR_FIELD_PATTERN = re.compile("|".join(
+    re.escape(field) for field in sorted(CAREER_SUGGESTIONS_BY_MAJOR, key=len, reverse=True)
+))
+
+# (interest keywords, careers) pairs for interest-based suggestions
+INTEREST_CAREER_SUGGESTIONS = (
+    (frozenset({"data", "analytics"}), ("Data Scientist", "Data Analyst", "Business Intelligence Analyst")),
+    (frozenset({"software", "programming"}), ("Software Engineer", "Full Stack Developer", "DevOps Engineer")),
+    (frozenset({"business", "management"}), ("Product Manager", "Business Analyst", "Management Consultant")),
+)
+
+# Follow-up questions, each asked when its profile field is still empty.
+# Read-only views so the shared templates can't be mutated through a response.
+MAX_SMART_QUESTIONS = 3  # Limit to avoid overwhelming the user
+SMART_QUESTION_TEMPLATES = (
+    MappingProxyType({
+        "question": "What programming languages or technical skills do you already know?",
+        "field": "current_skills",
+        "type": "multi_select",
+        "options": ("Python", "Java", "JavaScript", "SQL", "R", "C++", "HTML/CSS", "Git", "Excel", "PowerBI")
+    }),
+    MappingProxyType({
+        "question": "What skills do you want to develop for your career goal?",
+        "field": "target_skills",
+        "type": "multi_select",
+        "options": ("Machine Learning", "Data Analysis", "Web Development", "Cloud Computing", "Project Management")
+    }),
+    MappingProxyType({
+        "question": "What UTD courses have you already taken?",
+        "field": "completed_courses",
+        "type": "search_select",
+        "placeholder": "Search for courses (e.g., CS 1337, MATH 2414)"
+    }),
+    MappingProxyType({
+        "question": "What industries interest you?",
+        "field": "industry_interests",
+        "type": "multi_select",
+        "options": ("Technology", "Finance", "Healthcare", "Education", "Consulting", "Startups", "Government")
+    }),
+)
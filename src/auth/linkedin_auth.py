@@ -4,15 +4,40 @@ Handles LinkedIn login and session management
 """
 
 import asyncio
-import json
+import logging
 import os
+import re
+import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from typing import Dict, Any, Optional, Tuple
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# LinkedIn pages a user lands on once signed in. Matched as whole path segments
+# so e.g. a checkpoint URL carrying "feed" in its query string doesn't count.
+LOGGED_IN_URL_RE = re.compile(r"linkedin\.com/(?:feed|mynetwork|jobs)(?:[/?#]|$)")
+AUTO_LOGIN_URL_RE = re.compile(r"linkedin\.com/(?:feed|mynetwork)(?:[/?#]|$)")
+
+# Bundled chromedriver locations, in priority order; falls back to the system one
+CHROMEDRIVER_CANDIDATES = (
+    "bin/chromedriver.exe",
+    "bin/chromedriver-win.exe",
+    "chromedriver.exe",
+    "chromedriver"
+)
+
+def _url_matches(pattern: "re.Pattern[str]"):
+    """WebDriverWait condition: the current URL matches a precompiled pattern"""
+    return lambda driver: pattern.search(driver.current_url) is not None
+
+class LinkedInSession(BaseModel):
+    """Persisted LinkedIn session status (data/linkedin_session.json)"""
+    authenticated: bool
+    authenticated_at: datetime
+    session_timeout: int
 
 class LinkedInAuthenticator:
     """
@@ -25,9 +50,45 @@ class LinkedInAuthenticator:
         self.session_file = "data/linkedin_session.json"
         self.session_timeout = 24 * 60 * 60  # 24 hours in seconds
         self.auth_timeout = 300  # 5 minutes for manual login
+        # (mtime_ns, size, parsed session) of the last session file read
+        self._session_cache: Optional[Tuple[int, int, LinkedInSession]] = None
+        # Result of the one-time chromedriver lookup
+        self._chromedriver_searched = False
+        self._chromedriver_path: Optional[str] = None
+        
+    def _find_chromedriver(self) -> Optional[str]:
+        """
+        Locate a bundled chromedriver, checking candidates in priority order
+
+        Each directory is listed once (instead of a stat per candidate) and the
+        result is remembered for later logins.
+        """
+        if self._chromedriver_searched:
+            return self._chromedriver_path
         
+        listings: Dict[str, set] = {}
+        for directory in {os.path.dirname(path) or "." for path in CHROMEDRIVER_CANDIDATES}:
+            try:
+                with os.scandir(directory) as entries:
+                    listings[directory] = {entry.name for entry in entries}
+            except OSError:
+                listings[directory] = set()
+        
+        self._chromedriver_path = next(
+            (path for path in CHROMEDRIVER_CANDIDATES
+             if os.path.basename(path) in listings[os.path.dirname(path) or "."]),
+            None
+        )
+        self._chromedriver_searched = True
+        return self._chromedriver_path
+    
     def _setup_driver(self) -> bool:
         """Setup Chrome driver for LinkedIn authentication"""
+        # Selenium is only needed for an interactive login, so import it lazily
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        
         try:
             options = Options()
             options.add_argument("--start-maximized")
@@ -39,89 +100,132 @@ class LinkedInAuthenticator:
             options.add_argument("--disable-gpu")
             
             # Run in visible mode for authentication
-            print("🌐 Opening browser for LinkedIn authentication...")
+            logger.info("🌐 Opening browser for LinkedIn authentication...")
             
             # Try to find chromedriver
-            chromedriver_paths = [
-                "bin/chromedriver.exe",
-                "bin/chromedriver-win.exe", 
-                "chromedriver.exe",
-                "chromedriver"
-            ]
-            
-            driver_path = None
-            for path in chromedriver_paths:
-                if os.path.exists(path):
-                    driver_path = path
-                    break
+            driver_path = self._find_chromedriver()
             
             if driver_path:
-                self.driver = webdriver.Chrome(driver_path, options=options)
+                self.driver = webdriver.Chrome(service=Service(driver_path), options=options)
             else:
                 # Try system chromedriver
                 self.driver = webdriver.Chrome(options=options)
             
-            # Set timeouts
-            self.driver.implicitly_wait(10)
+            # Set timeouts (no implicit wait: element lookups use explicit waits)
             self.driver.set_page_load_timeout(30)
             
-            print("✅ Chrome driver initialized for LinkedIn authentication")
+            logger.info("✅ Chrome driver initialized for LinkedIn authentication")
             return True
             
         except Exception as e:
-            print(f"❌ Error setting up Chrome driver: {e}")
+            logger.error("❌ Error setting up Chrome driver: %s", e)
             return False
     
+    def _start_progress_reporter(self, interval: int = 30) -> threading.Event:
+        """
+        Print the remaining login time every `interval` seconds in the background
+
+        Returns:
+            threading.Event: Set it to stop reporting
+        """
+        stop = threading.Event()
+        deadline = time.monotonic() + self.auth_timeout
+
+        def report():
+            while not stop.wait(interval):
+                remaining = int(deadline - time.monotonic())
+                if remaining <= 0:
+                    return
+                logger.debug("⏰ Still waiting... %sm %ss remaining", remaining // 60, remaining % 60)
+
+        threading.Thread(target=report, daemon=True).start()
+        return stop
+    
+    def _load_session(self) -> Optional[LinkedInSession]:
+        """
+        Load the saved LinkedIn session, or None if there isn't one
+
+        The parsed session is cached against the file's mtime and size, so repeat
+        auth checks cost a single stat until the file is rewritten or removed.
+        """
+        try:
+            st = os.stat(self.session_file)
+        except FileNotFoundError:
+            self._session_cache = None
+            return None
+        
+        cache = self._session_cache
+        if cache is not None and cache[0] == st.st_mtime_ns and cache[1] == st.st_size:
+            return cache[2]
+        
+        with open(self.session_file, 'rb') as f:
+            session = LinkedInSession.model_validate_json(f.read())
+        self._session_cache = (st.st_mtime_ns, st.st_size, session)
+        return session
+    
     def _check_existing_session(self) -> bool:
         """Check if there's a valid existing LinkedIn session"""
-        if not os.path.exists(self.session_file):
-            return False
-        
         try:
-            with open(self.session_file, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
+            session = self._load_session()
+            if session is None:
+                return False
             
             # Check if session is still valid
-            session_time = datetime.fromisoformat(session_data.get('authenticated_at', ''))
-            if datetime.now() - session_time > timedelta(seconds=self.session_timeout):
-                print("📅 LinkedIn session expired")
+            if datetime.now() - session.authenticated_at > timedelta(seconds=self.session_timeout):
+                logger.info("📅 LinkedIn session expired")
                 return False
             
-            print("✅ Valid LinkedIn session found")
+            logger.info("✅ Valid LinkedIn session found")
             return True
             
         except Exception as e:
-            print(f"❌ Error checking session: {e}")
+            logger.error("❌ Error checking session: %s", e)
             return False
     
     def _save_session(self, success: bool = True) -> None:
         """Save LinkedIn session status"""
         os.makedirs("data", exist_ok=True)
         
-        session_data = {
-            "authenticated": success,
-            "authenticated_at": datetime.now().isoformat(),
-            "session_timeout": self.session_timeout
-        }
+        session = LinkedInSession(
+            authenticated=success,
+            authenticated_at=datetime.now(),
+            session_timeout=self.session_timeout
+        )
         
-        with open(self.session_file, 'w', encoding='utf-8') as f:
-            json.dump(session_data, f, indent=2)
+        # Write to a temp file and atomically swap it in, so a crash mid-write
+        # never leaves a truncated session file behind
+        session_dir = os.path.dirname(self.session_file) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=session_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(session.model_dump_json(indent=2))
+            os.replace(tmp_path, self.session_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
         
         if success:
-            print("💾 LinkedIn session saved successfully")
+            logger.info("💾 LinkedIn session saved successfully")
         else:
-            print("💾 LinkedIn authentication failed - session not saved")
+            logger.info("💾 LinkedIn authentication failed - session not saved")
     
     async def authenticate_linkedin(self) -> bool:
         """
         Authenticate with LinkedIn
         Returns True if authentication successful, False otherwise
+
+        Selenium and the session file are blocking, so the whole flow runs in a
+        worker thread and the event loop stays free for other requests.
         """
-        print("🔐 LinkedIn Authentication Required")
-        print("=" * 50)
-        print("📝 To access real job market data, you need to authenticate with LinkedIn")
-        print("⏰ You will have 5 minutes to complete the login process")
-        print("=" * 50)
+        return await asyncio.to_thread(self._authenticate_sync)
+    
+    def _authenticate_sync(self) -> bool:
+        """Blocking LinkedIn login flow behind authenticate_linkedin"""
+        logger.info("🔐 LinkedIn Authentication Required")
+        logger.info("=" * 50)
+        logger.info("📝 To access real job market data, you need to authenticate with LinkedIn")
+        logger.info("⏰ You will have 5 minutes to complete the login process")
+        logger.info("=" * 50)
         
         # Check for existing valid session
         if self._check_existing_session():
@@ -129,79 +233,84 @@ class LinkedInAuthenticator:
         
         # Setup driver
         if not self._setup_driver():
-            print("❌ Cannot setup browser for LinkedIn authentication")
+            logger.error("❌ Cannot setup browser for LinkedIn authentication")
             self._save_session(False)
             return False
         
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
         try:
             # Navigate to LinkedIn login
-            print("🔐 Opening LinkedIn login page...")
+            logger.info("🔐 Opening LinkedIn login page...")
             self.driver.get("https://www.linkedin.com/login")
-            time.sleep(3)
             
             # Try automatic login if credentials are provided
             linkedin_email = os.getenv("LINKEDIN_EMAIL", "")
             linkedin_password = os.getenv("LINKEDIN_PASSWORD", "")
             
             if linkedin_email and linkedin_password:
-                print("🔐 Attempting automatic login...")
+                logger.info("🔐 Attempting automatic login...")
                 try:
-                    email_field = self.driver.find_element(By.ID, "username")
-                    password_field = self.driver.find_element(By.ID, "password")
+                    # Wait for the login form itself rather than sleeping after page load
+                    form_wait = WebDriverWait(self.driver, 10)
+                    email_field = form_wait.until(EC.presence_of_element_located((By.ID, "username")))
+                    password_field = form_wait.until(EC.presence_of_element_located((By.ID, "password")))
                     
                     email_field.send_keys(linkedin_email)
                     password_field.send_keys(linkedin_password)
                     
                     # Click login button
-                    login_button = self.driver.find_element(By.XPATH, '//button[@type="submit"]')
+                    login_button = form_wait.until(
+                        EC.element_to_be_clickable((By.XPATH, '//button[@type="submit"]'))
+                    )
                     login_button.click()
-                    time.sleep(5)
                     
-                    # Check if login was successful
-                    if "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url:
-                        print("✅ LinkedIn automatic login successful")
+                    # Check if login was successful (returns as soon as LinkedIn redirects)
+                    try:
+                        WebDriverWait(self.driver, 5).until(_url_matches(AUTO_LOGIN_URL_RE))
+                        logger.info("✅ LinkedIn automatic login successful")
                         self._save_session(True)
                         return True
-                    else:
-                        print("⚠️ Automatic login failed, please login manually")
+                    except TimeoutException:
+                        logger.warning("⚠️ Automatic login failed, please login manually")
                 except Exception as e:
-                    print(f"⚠️ Automatic login failed: {e}")
-                    print("📝 Please login manually in the browser window")
+                    logger.warning("⚠️ Automatic login failed: %s", e)
+                    logger.info("📝 Please login manually in the browser window")
             else:
-                print("📝 No credentials provided, please login manually")
+                logger.info("📝 No credentials provided, please login manually")
             
             # Wait for manual login
-            print("⏰ Waiting for manual LinkedIn login (5 minutes)...")
-            print("💡 Please complete the login process in the browser window")
+            logger.info("⏰ Waiting for manual LinkedIn login (5 minutes)...")
+            logger.info("💡 Please complete the login process in the browser window")
             
-            for i in range(self.auth_timeout):
-                time.sleep(1)
-                current_url = self.driver.current_url
-                
-                # Check if user has successfully logged in
-                if "feed" in current_url or "mynetwork" in current_url or "jobs" in current_url:
-                    print("✅ Manual LinkedIn login detected!")
-                    self._save_session(True)
-                    return True
-                
-                # Show progress every 30 seconds
-                if i % 30 == 0 and i > 0:
-                    remaining_minutes = (self.auth_timeout - i) // 60
-                    remaining_seconds = (self.auth_timeout - i) % 60
-                    print(f"⏰ Still waiting... {remaining_minutes}m {remaining_seconds}s remaining")
+            # Let Selenium poll for the post-login redirect; progress is reported
+            # from a background timer instead of from the wait loop
+            stop_progress = self._start_progress_reporter()
+            try:
+                WebDriverWait(self.driver, self.auth_timeout).until(_url_matches(LOGGED_IN_URL_RE))
+                logger.info("✅ Manual LinkedIn login detected!")
+                self._save_session(True)
+                return True
+            except TimeoutException:
+                pass
+            finally:
+                stop_progress.set()
             
-            print("⏰ Authentication timeout reached")
+            logger.info("⏰ Authentication timeout reached")
             self._save_session(False)
             return False
             
         except Exception as e:
-            print(f"❌ Error during LinkedIn authentication: {e}")
+            logger.error("❌ Error during LinkedIn authentication: %s", e)
             self._save_session(False)
             return False
         finally:
             if self.driver:
                 self.driver.quit()
-                print("🌐 Browser closed")
+                logger.info("🌐 Browser closed")
     
     def is_authenticated(self) -> bool:
         """Check if user is currently authenticated with LinkedIn"""
@@ -211,11 +320,10 @@ class LinkedInAuthenticator:
         """Get current authentication status"""
         if self.is_authenticated():
             try:
-                with open(self.session_file, 'r', encoding='utf-8') as f:
-                    session_data = json.load(f)
+                session = self._load_session()
                 return {
                     "authenticated": True,
-                    "authenticated_at": session_data.get('authenticated_at'),
+                    "authenticated_at": session.authenticated_at.isoformat(),
                     "status": "LinkedIn session active"
                 }
             except:
@@ -234,10 +342,10 @@ class LinkedInAuthenticator:
         try:
             if os.path.exists(self.session_file):
                 os.remove(self.session_file)
-            print("✅ LinkedIn session cleared")
+            logger.info("✅ LinkedIn session cleared")
             return True
         except Exception as e:
-            print(f"❌ Error clearing session: {e}")
+            logger.error("❌ Error clearing session: %s", e)
             return False
 
 
@@ -250,33 +358,36 @@ async def require_linkedin_auth() -> bool:
     Require LinkedIn authentication before proceeding
     This function should be called at the start of the application
     """
-    print("🚀 UTD Career Guidance AI System")
-    print("=" * 50)
-    print("🔐 LinkedIn Authentication Required")
-    print("📊 To provide real job market data, we need to authenticate with LinkedIn")
-    print("=" * 50)
+    logger.info("🚀 UTD Career Guidance AI System")
+    logger.info("=" * 50)
+    logger.info("🔐 LinkedIn Authentication Required")
+    logger.info("📊 To provide real job market data, we need to authenticate with LinkedIn")
+    logger.info("=" * 50)
     
-    if linkedin_auth.is_authenticated():
-        print("✅ LinkedIn authentication verified")
+    if await asyncio.to_thread(linkedin_auth.is_authenticated):
+        logger.info("✅ LinkedIn authentication verified")
         return True
     
-    print("❌ LinkedIn authentication required")
-    print("🔐 Please authenticate with LinkedIn to continue...")
+    logger.error("❌ LinkedIn authentication required")
+    logger.info("🔐 Please authenticate with LinkedIn to continue...")
     
     # Attempt authentication
     success = await linkedin_auth.authenticate_linkedin()
     
     if success:
-        print("✅ LinkedIn authentication successful!")
-        print("🎉 You can now access real job market data")
+        logger.info("✅ LinkedIn authentication successful!")
+        logger.info("🎉 You can now access real job market data")
         return True
     else:
-        print("❌ LinkedIn authentication failed")
-        print("⚠️ You can still use the system with limited data")
+        logger.error("❌ LinkedIn authentication failed")
+        logger.warning("⚠️ You can still use the system with limited data")
         return False
 
 
 if __name__ == "__main__":
+    from src.config.logging_config import setup_logging
+    setup_logging()
+    
     # Test the authentication
     async def test_auth():
         success = await require_linkedin_auth()
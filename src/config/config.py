@@ -1,32 +1,70 @@
+import logging
 import os
-import boto3
+import threading
+from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
 
-# Load environment variables
+# Load environment variables once, at first import; every module that needs
+# .env values imports this one (directly or through BedrockService)
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# boto3 sessions aren't thread-safe for client creation, so guard the cache misses
+_client_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _get_session(region: str, access_key_id: Optional[str], secret_access_key: Optional[str]) -> "boto3.Session":
+    """One shared boto3 session per region/credentials, so credential resolution
+    and the botocore service model loader are reused across clients"""
+    import boto3  # imported on first use; modules that only read config skip it
+
+    # With no keys, boto3 falls back to the environment's IAM role (deployed)
+    return boto3.Session(
+        region_name=region,
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+    )
+
+@lru_cache(maxsize=None)
+def _get_client(service_name: str, region: str, access_key_id: Optional[str], secret_access_key: Optional[str]):
+    """Build a boto3 client once and reuse it; boto3 clients are thread-safe"""
+    from botocore.config import Config
+
+    # A bigger keep-alive pool for concurrent agent calls, and adaptive retries
+    # so Bedrock throttling backs off instead of failing the request
+    client_config = Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 5},
+    )
+    with _client_lock:
+        return _get_session(region, access_key_id, secret_access_key).client(service_name, config=client_config)
+
 class AWSConfig:
     """AWS Configuration and client setup for the UTD Career Advisory AI System"""
 
     def __init__(self):
         """Initialize AWS configuration from environment variables"""
-        self.aws_access_key_id = os.getenv("AWS_ACCESS_KEY_ID")
-        self.aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-        self.aws_region = os.getenv("AWS_REGION", "us-east-2")
-        self.bedrock_model_id = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-sonnet-20240229-v1:0")
-        self.bedrock_endpoint = os.getenv("BEDROCK_ENDPOINT") # Optional
+        env = os.environ
+        self.aws_access_key_id = env.get("AWS_ACCESS_KEY_ID")
+        self.aws_secret_access_key = env.get("AWS_SECRET_ACCESS_KEY")
+        self.aws_region = env.get("AWS_REGION", "us-east-2")
+        self.bedrock_model_id = env.get("BEDROCK_MODEL_ID", "anthropic.claude-3-sonnet-20240229-v1:0")
+        self.bedrock_endpoint = env.get("BEDROCK_ENDPOINT") # Optional
 
         # Scraping configuration
-        self.rapidapi_key = os.getenv("RAPIDAPI_KEY")
-        self.rapidapi_host = os.getenv("RAPIDAPI_HOST", "indeed12.p.rapidapi.com")
-        self.scraping_delay_min = int(os.getenv("SCRAPING_DELAY_MIN", "2"))
-        self.scraping_delay_max = int(os.getenv("SCRAPING_DELAY_MAX", "5"))
-        self.max_jobs_per_source = int(os.getenv("MAX_JOBS_PER_SOURCE", "20"))
-        self.cache_ttl_hours = int(os.getenv("CACHE_TTL_HOURS", "24"))
+        self.rapidapi_key = env.get("RAPIDAPI_KEY")
+        self.rapidapi_host = env.get("RAPIDAPI_HOST", "indeed12.p.rapidapi.com")
+        self.scraping_delay_min = int(env.get("SCRAPING_DELAY_MIN", "2"))
+        self.scraping_delay_max = int(env.get("SCRAPING_DELAY_MAX", "5"))
+        self.max_jobs_per_source = int(env.get("MAX_JOBS_PER_SOURCE", "20"))
+        self.cache_ttl_hours = int(env.get("CACHE_TTL_HOURS", "24"))
         
         # UTD Course Catalog configuration
-        self.utd_course_catalog_url = os.getenv("UTD_COURSE_CATALOG_URL", "https://coursebook.utdallas.edu/")
-        self.target_departments = os.getenv("TARGET_DEPARTMENTS", "CS,SE,MATH,STAT,BA,SYSM").split(",")
+        self.utd_course_catalog_url = env.get("UTD_COURSE_CATALOG_URL", "https://coursebook.utdallas.edu/")
+        self.target_departments = env.get("TARGET_DEPARTMENTS", "CS,SE,MATH,STAT,BA,SYSM").split(",")
 
         # Validate required configuration
         self._validate_config()
@@ -43,51 +81,31 @@ class AWSConfig:
 
         # Warn about optional but recommended configurations
         if not self.rapidapi_key:
-            print("Warning: RAPIDAPI_KEY not set. Indeed scraping will be limited.")
+            logger.warning("Warning: RAPIDAPI_KEY not set. Indeed scraping will be limited.")
 
-    def get_bedrock_client(self):
-        """Get an AWS Bedrock runtime client."""
+    def _client(self, service_name: str):
+        """Get a cached AWS client for this configuration's region and credentials"""
         # If keys are provided, use them (local development).
         # Otherwise, let boto3 use the environment's IAM role (deployed).
         if self.aws_access_key_id and self.aws_secret_access_key:
-            return boto3.client(
-                service_name="bedrock-runtime",
-                region_name=self.aws_region,
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-            )
-        else:
-            return boto3.client(
-                service_name="bedrock-runtime",
-                region_name=self.aws_region,
-            )
+            return _get_client(service_name, self.aws_region, self.aws_access_key_id, self.aws_secret_access_key)
+        return _get_client(service_name, self.aws_region, None, None)
+
+    def get_bedrock_client(self):
+        """Get an AWS Bedrock runtime client."""
+        return self._client("bedrock-runtime")
 
     def get_s3_client(self):
         """Get an AWS S3 client"""
-        return boto3.client(
-            service_name="s3",
-            region_name=self.aws_region,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key
-        )
+        return self._client("s3")
 
     def get_dynamodb_client(self):
         """Get an AWS DynamoDB client"""
-        return boto3.client(
-            service_name="dynamodb",
-            region_name=self.aws_region,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key
-        )
+        return self._client("dynamodb")
 
     def get_bedrock_agent_client(self):
         """Get an AWS Bedrock agent client"""
-        return boto3.client(
-            service_name="bedrock-agent",
-            region_name=self.aws_region,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key
-        )
+        return self._client("bedrock-agent")
     
     def get_scraping_config(self):
         """Get scraping configuration"""
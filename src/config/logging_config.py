@@ -0,0 +1,40 @@
+"""
+Logging setup for the UTD Career Guidance AI System
+
+Log records are handed to a queue on the calling thread and written to the
+console by a background listener, so request and auth threads never block on
+stdout.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route root logging through a QueueHandler drained by a background listener
+
+    Safe to call more than once; only the first call installs the handlers.
+
+    Args:
+        level (int): Minimum level to emit (DEBUG shows auth progress messages)
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(log_queue, console, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -1,28 +1,52 @@
-import json
-from botocore.exceptions import ClientError
+import asyncio
+import logging
+import orjson
+from typing import Any, Dict, Optional, Tuple
 from src.config.config import AWSConfig
 
+logger = logging.getLogger(__name__)
+
 class BedrockService:
     """Service for interacting with AWS Bedrock models"""
 
+    # Bedrock calls currently in flight, shared across instances so that
+    # identical concurrent requests from different agents coalesce too
+    _inflight: Dict[
+        Tuple[str, str, int, float, Optional[str], Optional[str]], "asyncio.Task[Dict[str, Any]]"
+    ] = {}
+
     def __init__(self):
         """Initialize the Bedrock service"""
-        aws_config = AWSConfig()
-        self.client = aws_config.get_bedrock_client()
-        self.model_id = aws_config.bedrock_model_id
+        self._aws_config = AWSConfig()
+        self.model_id = self._aws_config.bedrock_model_id
+        self._client = None
+
+    @property
+    def client(self):
+        """Bedrock runtime client, created on first invocation"""
+        if self._client is None:
+            self._client = self._aws_config.get_bedrock_client()
+        return self._client
 
-    def invoke_model(self, prompt, max_tokens=1000, temperature=0.7):
+    def invoke_model(self, prompt, max_tokens=1000, temperature=0.7, system=None, cacheable_prefix=None):
         """
         Invoke the Bedrock model with a prompt
 
+        The cacheable prefix is sent as the last system block with a prompt
+        cache checkpoint, so repeated calls sharing it (>= 1024 tokens) are
+        served from Bedrock's prompt cache instead of being reprocessed.
+
         Args:
             prompt (str): The prompt to send to the model
             max_tokens (int): Maximum number of tokens to generate
             temperature (float): Temperature for generation (0.0-1.0)
+            system (str): Optional system instructions
+            cacheable_prefix (str): Optional static context shared across calls
 
         Returns:
-            dict: The model response
+            dict: The model response, including prompt cache token usage
         """
+        from botocore.exceptions import ClientError  # deferred so importing this module skips botocore
         try:
             # Prepare request body based on model type
             if "anthropic.claude" in self.model_id:
@@ -31,33 +55,80 @@ class BedrockService:
                     "max_tokens": max_tokens,
                     "temperature": temperature,
                     "messages": [
-                        {"role": "user", "content": prompt}
+                        {"role": "user", "content": [{"type": "text", "text": prompt}]}
                     ]
                 }
+
+                system_blocks = []
+                if system:
+                    system_blocks.append({"type": "text", "text": system})
+                if cacheable_prefix:
+                    system_blocks.append({
+                        "type": "text",
+                        "text": cacheable_prefix,
+                        "cache_control": {"type": "ephemeral"}
+                    })
+                if system_blocks:
+                    request_body["system"] = system_blocks
             else:
                 raise ValueError(f"Unsupported model: {self.model_id}")
 
             # Invoke the model
             response = self.client.invoke_model(
                 modelId=self.model_id,
-                body=json.dumps(request_body)
+                body=orjson.dumps(request_body)
             )
 
             # Parse and return response
-            response_body = json.loads(response.get('body').read())
+            response_body = orjson.loads(response.get('body').read())
 
             if "anthropic.claude" in self.model_id:
+                usage = response_body.get("usage", {})
                 return {
                     "content": response_body.get("content", [{}])[0].get("text", ""),
+                    "cache_read_input_tokens": usage.get("cache_read_input_tokens", 0),
+                    "cache_creation_input_tokens": usage.get("cache_creation_input_tokens", 0),
                     "raw_response": response_body
                 }
             else:
                 return {"content": "", "raw_response": response_body}
 
         except ClientError as e:
-            print(f"Error invoking Bedrock model: {e}")
+            logger.error("Error invoking Bedrock model: %s", e)
             return {"content": "", "error": str(e)}
 
+    async def invoke_model_async(self, prompt, max_tokens=1000, temperature=0.7, system=None, cacheable_prefix=None):
+        """
+        Invoke the Bedrock model without blocking the event loop
+
+        Identical concurrent calls (same model, prompt and generation settings)
+        share a single Bedrock invocation: later callers await the result of
+        the call already in flight instead of issuing their own.
+
+        Args:
+            prompt (str): The prompt to send to the model
+            max_tokens (int): Maximum number of tokens to generate
+            temperature (float): Temperature for generation (0.0-1.0)
+            system (str): Optional system instructions
+            cacheable_prefix (str): Optional static context shared across calls
+
+        Returns:
+            dict: The model response
+        """
+        key = (self.model_id, prompt, max_tokens, temperature, system, cacheable_prefix)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                asyncio.to_thread(
+                    self.invoke_model, prompt, max_tokens, temperature, system, cacheable_prefix
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so a cancelled caller doesn't cancel the call for everyone else
+        return await asyncio.shield(task)
+
     def create_agent_knowledge_base(self, name, description, s3_bucket, s3_prefix):
         """
         Create a knowledge base for an agent
@@ -71,8 +142,9 @@ class BedrockService:
         Returns:
             str: The knowledge base ID
         """
+        from botocore.exceptions import ClientError
         try:
-            bedrock_agent = AWSConfig().get_bedrock_agent_client()
+            bedrock_agent = self._aws_config.get_bedrock_agent_client()
 
             response = bedrock_agent.create_knowledge_base(
                 name=name,
@@ -81,7 +153,7 @@ class BedrockService:
                 knowledgeBaseConfiguration={
                     "type": "VECTOR",
                     "vectorKnowledgeBaseConfiguration": {
-                        "embeddingModelArn": f"arn:aws:bedrock:{AWSConfig().aws_region}::foundation-model/amazon.titan-embed-text-v1"
+                        "embeddingModelArn": f"arn:aws:bedrock:{self._aws_config.aws_region}::foundation-model/amazon.titan-embed-text-v1"
                     }
                 },
                 storageConfiguration={
@@ -96,5 +168,5 @@ class BedrockService:
             return response.get("knowledgeBase", {}).get("knowledgeBaseId", "")
 
         except ClientError as e:
-            print(f"Error creating knowledge base: {e}")
+            logger.error("Error creating knowledge base: %s", e)
             return ""
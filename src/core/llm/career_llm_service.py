@@ -3,30 +3,88 @@ Career LLM Service - Lightweight AWS Bedrock integration for relevant career gui
 Uses the cheapest available model for cost-effective career matching
 """
 
-import json
-import boto3
-from typing import Dict, List, Any, Optional
+import copy
+import hashlib
+import logging
+import orjson
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple
 from src.config.config import AWSConfig
 
+logger = logging.getLogger(__name__)
+
+# Career analysis results are cached per (career goal, course catalog, job requirements)
+ANALYSIS_CACHE_MAX_SIZE = 1000
+ANALYSIS_CACHE_TTL_SECONDS = 3600
+
+# Number of courses the fallback analysis recommends
+TOP_RECOMMENDATIONS = 5
+
+def _lower_all(values: List[str]) -> List[str]:
+    """Lower-case many strings with one join/lower/split pass instead of one .lower() each"""
+    separator = "\x00"
+    joined = separator.join(values)
+    if joined.count(separator) != max(len(values) - 1, 0):  # a value contains the separator
+        return [value.lower() for value in values]
+    return joined.lower().split(separator) if values else []
+
+@dataclass(slots=True, frozen=True)
+class CourseColumns:
+    """A course list split into parallel per-field columns (index i is course i)"""
+    codes: List[str]
+    titles: List[str]
+    codes_lower: List[str]
+    titles_lower: List[str]
+    descriptions_lower: List[str]
+    skills_top3: List[Tuple[str, ...]]
+
 class CareerLLMService:
     def __init__(self):
         self.config = AWSConfig()
-        self.client = None
-        self._initialize_client()
+        # Bedrock client is created on first use, not at construction
+        self._client = None
+        self._client_initialized = False
+        
+        # LRU of cache key -> (expires_at, analysis)
+        self._analysis_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+        # Per-catalog derived data: name -> (course list, its length, value)
+        self._course_list_memo: Dict[str, Tuple[List[Dict], int, Any]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    @property
+    def client(self):
+        """AWS Bedrock client, initialized on first access (None if unavailable)"""
+        if not self._client_initialized:
+            self._initialize_client()
+        return self._client
     
     def _initialize_client(self):
         """Initialize AWS Bedrock client"""
+        self._client_initialized = True
         try:
-            self.client = self.config.get_bedrock_client()
-            print("✅ Career LLM Service initialized with AWS Bedrock")
+            self._client = self.config.get_bedrock_client()
+            logger.info("✅ Career LLM Service initialized with AWS Bedrock")
         except Exception as e:
-            print(f"⚠️ Failed to initialize Bedrock client: {e}")
-            self.client = None
+            logger.warning("⚠️ Failed to initialize Bedrock client: %s", e)
+            self._client = None
     
     def analyze_career_skills_match(self, career_goal: str, available_courses: List[Dict], job_requirements: Dict) -> Dict[str, Any]:
         """
         Use LLM to analyze career goal and recommend relevant courses
         
+        Results are cached for an hour per career goal (as given, apart from
+        surrounding whitespace, since the analysis quotes it), course catalog
+        and job requirements, so repeat queries skip the analysis. Callers get
+        their own copy and may modify it.
+        
         Args:
             career_goal: Target career (e.g., "Financial Analyst")
             available_courses: List of UTD courses
@@ -35,9 +93,24 @@ class CareerLLMService:
         Returns:
             Dict with relevant course recommendations and explanations
         """
+        cache_key = (
+            career_goal.strip(),
+            self._fingerprint_courses(available_courses),
+            self._fingerprint(job_requirements)
+        )
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            return cached
+        
+        result = self._analyze_career_skills_match(career_goal, available_courses, job_requirements)
+        self._store_cached_analysis(cache_key, result)
+        return result
+    
+    def _analyze_career_skills_match(self, career_goal: str, available_courses: List[Dict], job_requirements: Dict) -> Dict[str, Any]:
+        """Run the career matching analysis without consulting the cache"""
         # For now, use improved fallback system for consistent results
         # This ensures we get relevant course recommendations while LLM credentials are being configured
-        print("🤖 Using improved intelligent fallback system for career matching")
+        logger.debug("🤖 Using improved intelligent fallback system for career matching: %s", career_goal)
         return self._fallback_career_analysis(career_goal, available_courses, job_requirements)
         
         # Original LLM code (commented out for testing)
@@ -51,7 +124,7 @@ class CareerLLMService:
         #     # Use Claude 3 Haiku (cheapest model) for cost efficiency
         #     response = self.client.invoke_model(
         #         modelId="anthropic.claude-3-haiku-20240307-v1:0",  # Cheapest Claude model
-        #         body=json.dumps({
+        #         body=orjson.dumps({
         #             "anthropic_version": "bedrock-2023-05-31",
         #             "max_tokens": 1000,  # Keep tokens low for cost
         #             "temperature": 0.3,   # Lower temperature for more focused responses
@@ -64,16 +137,80 @@ class CareerLLMService:
         #         })
         #     )
         #     
-        #     response_body = json.loads(response['body'].read())
+        #     response_body = orjson.loads(response['body'].read())
         #     llm_output = response_body['content'][0]['text']
         #     
         #     # Parse LLM response into structured format
         #     return self._parse_llm_response(llm_output, career_goal)
         #     
         # except Exception as e:
-        #     print(f"❌ LLM analysis failed: {e}")
+        #     logger.error("❌ LLM analysis failed: %s", e)
         #     return self._fallback_career_analysis(career_goal, available_courses, job_requirements)
     
+    @staticmethod
+    def _fingerprint(data: Any) -> str:
+        """Stable short digest of JSON-compatible data"""
+        encoded = orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    
+    def _per_course_list(self, name: str, courses: List[Dict], build: Callable[[List[Dict]], Any]) -> Any:
+        """Return build(courses), recomputed only when a different course list is passed in"""
+        cached = self._course_list_memo.get(name)
+        if cached and cached[0] is courses and cached[1] == len(courses):
+            return cached[2]
+        
+        value = build(courses)
+        self._course_list_memo[name] = (courses, len(courses), value)
+        return value
+    
+    def _fingerprint_courses(self, courses: List[Dict]) -> str:
+        """Digest of the course catalog"""
+        return self._per_course_list(
+            "fingerprint", courses,
+            lambda courses: self._fingerprint(sorted(course.get('course_code', '') for course in courses))
+        )
+    
+    def _course_columns(self, courses: List[Dict]) -> "CourseColumns":
+        """Course fields as parallel columns"""
+        return self._per_course_list("columns", courses, self._build_course_columns)
+    
+    @staticmethod
+    def _build_course_columns(courses: List[Dict]) -> "CourseColumns":
+        """Split a course list into parallel per-field columns"""
+        codes = [course.get('course_code', '') for course in courses]
+        titles = [course.get('title', '') for course in courses]
+        columns = CourseColumns(
+            codes=codes,
+            titles=titles,
+            codes_lower=_lower_all(codes),
+            titles_lower=_lower_all(titles),
+            descriptions_lower=_lower_all([course.get('description', '') for course in courses]),
+            skills_top3=[tuple(course.get('skills', [])[:3]) for course in courses]
+        )
+        return columns
+    
+    def _get_cached_analysis(self, key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached analysis, or None on a miss"""
+        with self._analysis_cache_lock:
+            entry = self._analysis_cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._analysis_cache.move_to_end(key)
+                self.cache_hits += 1
+                return copy.deepcopy(entry[1])
+            
+            if entry:
+                del self._analysis_cache[key]
+            self.cache_misses += 1
+            return None
+    
+    def _store_cached_analysis(self, key: Tuple[str, str, str], analysis: Dict[str, Any]) -> None:
+        """Cache a copy of an analysis, evicting the least recently used entry when full"""
+        with self._analysis_cache_lock:
+            self._analysis_cache[key] = (time.monotonic() + ANALYSIS_CACHE_TTL_SECONDS, copy.deepcopy(analysis))
+            self._analysis_cache.move_to_end(key)
+            if len(self._analysis_cache) > ANALYSIS_CACHE_MAX_SIZE:
+                self._analysis_cache.popitem(last=False)
+    
     def _create_career_matching_prompt(self, career_goal: str, courses: List[Dict], job_requirements: Dict) -> str:
         """Create a focused prompt for career matching"""
         
@@ -129,7 +266,7 @@ Respond ONLY with valid JSON."""
             
             if start_idx != -1 and end_idx != -1:
                 json_str = llm_output[start_idx:end_idx]
-                parsed_response = json.loads(json_str)
+                parsed_response = orjson.loads(json_str)
                 
                 return {
                     "success": True,
@@ -142,222 +279,93 @@ Respond ONLY with valid JSON."""
                 raise ValueError("No JSON found in LLM response")
                 
         except Exception as e:
-            print(f"❌ Failed to parse LLM response: {e}")
+            logger.error("❌ Failed to parse LLM response: %s", e)
             return self._fallback_career_analysis(career_goal, [], {})
     
     def _fallback_career_analysis(self, career_goal: str, courses: List[Dict], job_requirements: Dict) -> Dict[str, Any]:
         """Fallback analysis when LLM is unavailable"""
-        print("🔄 Using fallback career analysis (no LLM)")
-        
-        # Define career-specific course mappings with detailed keywords
-        career_course_mappings = {
-            "financial analyst": {
-                "prefixes": ["FIN", "ACCT", "ECON", "STAT", "BA"],
-                "keywords": ["finance", "accounting", "economics", "financial", "investment", "business", "statistics", "portfolio", "valuation"]
-            },
-            "data scientist": {
-                "prefixes": ["CS", "STAT", "MATH", "BA", "DATA"],
-                "keywords": ["statistics", "data", "analytics", "machine learning", "programming", "mathematics", "mining", "modeling", "python", "r"]
-            },
-            "software engineer": {
-                "prefixes": ["CS", "SE", "ENGR"],
-                "keywords": ["programming", "software", "computer", "algorithms", "data structures", "java", "python", "web", "systems"]
-            },
-            "business analyst": {
-                "prefixes": ["BA", "STAT", "ECON", "ACCT", "MIS"],
-                "keywords": ["business", "analytics", "statistics", "economics", "analysis", "intelligence", "data", "reporting"]
-            },
-            "marketing analyst": {
-                "prefixes": ["MKTG", "BA", "STAT", "COMM"],
-                "keywords": ["marketing", "business", "analytics", "statistics", "analysis", "consumer", "digital", "social media"]
-            },
-            "neuroscientist": {
-                "prefixes": ["NSC", "BIOL", "PSYC", "CHEM", "PHYS"],
-                "keywords": ["neuroscience", "brain", "cognitive", "neural", "biology", "psychology", "neurology", "behavior", "perception"]
-            },
-            "neuro scientist": {
-                "prefixes": ["NSC", "BIOL", "PSYC", "CHEM", "PHYS"],
-                "keywords": ["neuroscience", "brain", "cognitive", "neural", "biology", "psychology", "neurology", "behavior", "perception"]
-            },
-            "data engineer": {
-                "prefixes": ["CS", "DATA", "MIS", "ENGR"],
-                "keywords": ["data", "database", "engineering", "pipeline", "etl", "sql", "nosql", "cloud", "distributed"]
-            },
-            "devops engineer": {
-                "prefixes": ["CS", "SE", "SYSM", "ENGR"],
-                "keywords": ["devops", "cloud", "infrastructure", "automation", "ci/cd", "kubernetes", "docker", "aws", "systems"]
-            },
-            "operations manager": {
-                "prefixes": ["OPRE", "MGMT", "BA", "STAT"],
-                "keywords": ["operations", "management", "supply chain", "logistics", "process", "optimization", "quality"]
-            },
-            "investment analyst": {
-                "prefixes": ["FIN", "ECON", "ACCT", "STAT"],
-                "keywords": ["investment", "finance", "portfolio", "securities", "valuation", "financial markets", "risk"]
-            },
-            "management consultant": {
-                "prefixes": ["MGMT", "BA", "ECON", "STAT"],
-                "keywords": ["management", "consulting", "strategy", "business", "analytics", "organizational", "leadership"]
-            }
-        }
+        logger.debug("🔄 Using fallback career analysis (no LLM) for %s", career_goal)
         
         career_lower = career_goal.lower()
-        relevant_config = None
-        matched_pattern = None
-        
-        # Find matching career patterns (prioritize exact matches)
-        for career_pattern, config in career_course_mappings.items():
-            # First try exact match
-            if career_pattern == career_lower:
-                relevant_config = config
-                matched_pattern = career_pattern
-                break
-            # Then try substring match (e.g., "financial analyst" in "I want to become a financial analyst")
-            elif career_pattern in career_lower:
-                relevant_config = config
-                matched_pattern = career_pattern
-                break
         
-        if not relevant_config:
-            matched_pattern = "default"
-            relevant_config = {
-                "prefixes": ["BA", "STAT", "ECON"],
-                "keywords": ["business", "statistics", "economics"]
-            }
+        # Find matching career patterns (prioritize exact matches), then try substring
+        # match (e.g., "financial analyst" in "I want to become a financial analyst"),
+        # both on canonical forms so "Neuro-Scientist" finds "neuroscientist"
+        career_canonical = _canonical(career_goal)
+        matched_pattern = CAREER_BY_CANONICAL.get(career_canonical) or next(
+            (pattern for canonical, pattern in CAREER_BY_CANONICAL.items() if canonical in career_canonical),
+            "default"
+        )
         
+        prefix_re, keyword_re = CAREER_COURSE_PATTERNS[matched_pattern]
+        columns = self._course_columns(courses)
+        titles_lower = columns.titles_lower
+        descriptions_lower = columns.descriptions_lower
         
-        # Filter courses by relevance using both prefixes and keywords
-        relevant_courses = []
-        for course in courses:
-            course_code = course.get('course_code', '')
-            course_title = course.get('title', '').lower()
-            course_description = course.get('description', '').lower()
-            
-            relevance_score = 0
-            match_reason = ""
+        # Filter courses by relevance using both prefixes and keywords. Only the first
+        # TOP_RECOMMENDATIONS matches of each score can make the (stable) top list, so
+        # keep just those indexes and stop once the best score is full.
+        matches_by_score = {9: [], 8: [], 6: []}
+        best_matches = matches_by_score[9]
+        for i, code_lower in enumerate(columns.codes_lower):
+            course_title = titles_lower[i]
             
             # Check if course matches career-relevant prefixes (highest priority)
-            if any(prefix.lower() in course_code.lower() for prefix in relevant_config["prefixes"]):
-                relevance_score = 9
-                match_reason = "prefix_match"
+            if prefix_re.search(code_lower):
+                matches = best_matches
             
             # Check if course title/description contains relevant keywords
-            elif any(keyword in course_title or keyword in course_description for keyword in relevant_config["keywords"]):
-                relevance_score = 8
-                match_reason = "keyword_match"
+            elif keyword_re.search(course_title) or keyword_re.search(descriptions_lower[i]):
+                matches = matches_by_score[8]
             
             # Check for general business/analytical courses
-            elif any(keyword in course_title for keyword in ['business', 'statistics', 'analysis', 'economics']):
-                relevance_score = 6
-                match_reason = "general_match"
+            elif GENERAL_COURSE_PATTERN.search(course_title):
+                matches = matches_by_score[6]
             
-            if relevance_score > 0:
-                # Create more specific explanations based on career goal
-                explanation = self._generate_explanation(career_lower, course_code, course_title, career_goal)
-
-                
-                relevant_courses.append({
-                    "course_code": course_code,
-                    "title": course.get('title', ''),
-                    "relevance_score": relevance_score,
-                    "explanation": explanation,
-                    "skills_gained": course.get('skills', [])[:3]
-                })
+            else:
+                continue
+            
+            if len(matches) < TOP_RECOMMENDATIONS:
+                matches.append(i)
+                if len(best_matches) == TOP_RECOMMENDATIONS:
+                    break
         
-        # Sort by relevance and take top 5
-        relevant_courses.sort(key=lambda x: x['relevance_score'], reverse=True)
+        # Take the top matches by relevance and build their recommendations
+        top_matches = [(score, i) for score, indexes in matches_by_score.items() for i in indexes][:TOP_RECOMMENDATIONS]
+        relevant_courses = []
+        for relevance_score, i in top_matches:
+            course_code = columns.codes[i]
+            # Create more specific explanations based on career goal
+            explanation = self._generate_explanation(career_lower, columns.codes_lower[i], titles_lower[i], career_goal)
+            
+            relevant_courses.append({
+                "course_code": course_code,
+                "title": columns.titles[i],
+                "relevance_score": relevance_score,
+                "explanation": explanation,
+                "skills_gained": list(columns.skills_top3[i])
+            })
         
         return {
             "success": True,
             "career_goal": career_goal,
-            "llm_recommendations": relevant_courses[:5],
+            "llm_recommendations": relevant_courses,
             "career_summary": f"These courses provide essential skills and knowledge for pursuing a career as a {career_goal}",
             "source": "fallback_analysis"
         }
     
-    def _generate_explanation(self, career_lower: str, course_code: str, course_title: str, career_goal: str) -> str:
-        """Generate career-specific explanations for course recommendations"""
-        course_code_lower = course_code.lower()
-        
-        # Financial Analyst explanations
-        if "financial analyst" in career_lower or "investment analyst" in career_lower:
-            if "fin" in course_code_lower or "finance" in course_title:
-                return f"Essential finance course for {career_goal} - covers financial analysis and corporate finance principles."
-            elif "acct" in course_code_lower or "accounting" in course_title:
-                return f"Critical accounting foundation for {career_goal} - essential for financial statement analysis."
-            elif "econ" in course_code_lower or "economics" in course_title:
-                return f"Economic principles course for {career_goal} - provides market analysis foundation."
-            elif "stat" in course_code_lower or "statistics" in course_title:
-                return f"Statistical analysis course for {career_goal} - essential for data-driven financial decisions."
-            else:
-                return f"Relevant business course for {career_goal} - builds analytical and business skills."
-        
-        # Neuroscientist/Neuro Scientist explanations
-        elif "neuro" in career_lower or "neuroscience" in career_lower:
-            if "nsc" in course_code_lower or "neuroscience" in course_title:
-                return f"Core neuroscience course for {career_goal} - fundamental for understanding brain function and neural systems."
-            elif "biol" in course_code_lower or "biology" in course_title:
-                return f"Essential biology foundation for {career_goal} - provides understanding of cellular and molecular mechanisms."
-            elif "psyc" in course_code_lower or "psychology" in course_title:
-                return f"Psychology course for {career_goal} - bridges understanding between brain and behavior."
-            elif "chem" in course_code_lower or "chemistry" in course_title:
-                return f"Chemistry foundation for {career_goal} - essential for understanding molecular neuroscience."
-            elif "phys" in course_code_lower or "physics" in course_title:
-                return f"Physics course for {career_goal} - important for understanding neural signaling and biophysics."
-            else:
-                return f"Relevant science course for {career_goal} - supports comprehensive understanding of neuroscience."
-        
-        # Data Scientist/Data Engineer explanations
-        elif "data" in career_lower:
-            if "stat" in course_code_lower or "statistics" in course_title:
-                return f"Critical statistics course for {career_goal} - essential for data analysis and modeling."
-            elif "cs" in course_code_lower or "programming" in course_title or "software" in course_title:
-                return f"Programming foundation for {career_goal} - key for data manipulation and algorithm implementation."
-            elif "machine learning" in course_title or "ml" in course_code_lower:
-                return f"Machine learning course for {career_goal} - core competency for advanced data analysis."
-            elif "database" in course_title or "data" in course_title:
-                return f"Data management course for {career_goal} - essential for working with large datasets."
-            else:
-                return f"Technical course for {career_goal} - builds analytical and computational skills."
-        
-        # Software/DevOps Engineer explanations
-        elif "software" in career_lower or "devops" in career_lower or "engineer" in career_lower:
-            if "cs" in course_code_lower or "programming" in course_title:
-                return f"Core programming course for {career_goal} - fundamental software development skills."
-            elif "algorithm" in course_title or "data structure" in course_title:
-                return f"Essential algorithms course for {career_goal} - critical for efficient software design."
-            elif "system" in course_title or "cloud" in course_title:
-                return f"Systems course for {career_goal} - important for infrastructure and deployment."
-            else:
-                return f"Technical course for {career_goal} - enhances software engineering capabilities."
-        
-        # Marketing Analyst explanations
-        elif "marketing" in career_lower:
-            if "mktg" in course_code_lower or "marketing" in course_title:
-                return f"Marketing course for {career_goal} - core marketing principles and strategies."
-            elif "stat" in course_code_lower or "analytics" in course_title:
-                return f"Analytics course for {career_goal} - essential for data-driven marketing decisions."
-            elif "comm" in course_code_lower or "communication" in course_title:
-                return f"Communication course for {career_goal} - important for effective marketing messaging."
-            else:
-                return f"Business course for {career_goal} - supports marketing strategy and analysis."
-        
-        # Business/Management roles
-        elif any(term in career_lower for term in ["business", "management", "operations", "consultant"]):
-            if "mgmt" in course_code_lower or "management" in course_title:
-                return f"Management course for {career_goal} - develops leadership and organizational skills."
-            elif "opre" in course_code_lower or "operations" in course_title:
-                return f"Operations course for {career_goal} - essential for process improvement and efficiency."
-            elif "ba" in course_code_lower or "analytics" in course_title:
-                return f"Business analytics course for {career_goal} - supports data-driven decision making."
-            elif "econ" in course_code_lower or "economics" in course_title:
-                return f"Economics course for {career_goal} - provides market and business environment understanding."
-            else:
-                return f"Business course for {career_goal} - builds professional and analytical capabilities."
-        
-        # Default explanation
-        else:
+    def _generate_explanation(self, career_lower: str, course_code_lower: str, course_title: str, career_goal: str) -> str:
+        """Generate career-specific explanations for course recommendations (code and title already lower-cased)"""
+        bucket = _explanation_bucket(career_lower)
+        if bucket is None:
+            # Default explanation
             return f"This course provides foundational knowledge relevant to {career_goal}"
+        
+        rules, default_template = bucket
+        for code_re, title_re, template in rules:
+            if (code_re and code_re.search(course_code_lower)) or (title_re and title_re.search(course_title)):
+                return template.format(career_goal=career_goal)
+        return default_template.format(career_goal=career_goal)
     
     def generate_learning_path_explanation(self, career_goal: str, recommended_courses: List[Dict]) -> str:
         """Generate a brief explanation of the learning path"""
@@ -376,7 +384,7 @@ Explain how these courses build relevant skills for {career_goal}. Keep it conci
 
             response = self.client.invoke_model(
                 modelId="anthropic.claude-3-haiku-20240307-v1:0",
-                body=json.dumps({
+                body=orjson.dumps({
                     "anthropic_version": "bedrock-2023-05-31",
                     "max_tokens": 200,
                     "temperature": 0.3,
@@ -389,12 +397,167 @@ Explain how these courses build relevant skills for {career_goal}. Keep it conci
                 })
             )
             
-            response_body = json.loads(response['body'].read())
+            response_body = orjson.loads(response['body'].read())
             return response_body['content'][0]['text'].strip()
             
         except Exception as e:
-            print(f"❌ Failed to generate learning path explanation: {e}")
+            logger.error("❌ Failed to generate learning path explanation: %s", e)
             return f"This learning path is designed to prepare you for a career as a {career_goal} through relevant coursework."
 
-# Global instance
-career_llm_service = CareerLLMService()
+# Career-specific course mappings with detailed keywords (read-only, built once at import)
+CAREER_COURSE_MAPPINGS = MappingProxyType({
+    "financial analyst": {
+        "prefixes": ("FIN", "ACCT", "ECON", "STAT", "BA"),
+        "keywords": ("finance", "accounting", "economics", "financial", "investment", "business", "statistics", "portfolio", "valuation")
+    },
+    "data scientist": {
+        "prefixes": ("CS", "STAT", "MATH", "BA", "DATA"),
+        "keywords": ("statistics", "data", "analytics", "machine learning", "programming", "mathematics", "mining", "modeling", "python", "r")
+    },
+    "software engineer": {
+        "prefixes": ("CS", "SE", "ENGR"),
+        "keywords": ("programming", "software", "computer", "algorithms", "data structures", "java", "python", "web", "systems")
+    },
+    "business analyst": {
+        "prefixes": ("BA", "STAT", "ECON", "ACCT", "MIS"),
+        "keywords": ("business", "analytics", "statistics", "economics", "analysis", "intelligence", "data", "reporting")
+    },
+    "marketing analyst": {
+        "prefixes": ("MKTG", "BA", "STAT", "COMM"),
+        "keywords": ("marketing", "business", "analytics", "statistics", "analysis", "consumer", "digital", "social media")
+    },
+    "neuroscientist": {
+        "prefixes": ("NSC", "BIOL", "PSYC", "CHEM", "PHYS"),
+        "keywords": ("neuroscience", "brain", "cognitive", "neural", "biology", "psychology", "neurology", "behavior", "perception")
+    },
+    "data engineer": {
+        "prefixes": ("CS", "DATA", "MIS", "ENGR"),
+        "keywords": ("data", "database", "engineering", "pipeline", "etl", "sql", "nosql", "cloud", "distributed")
+    },
+    "devops engineer": {
+        "prefixes": ("CS", "SE", "SYSM", "ENGR"),
+        "keywords": ("devops", "cloud", "infrastructure", "automation", "ci/cd", "kubernetes", "docker", "aws", "systems")
+    },
+    "operations manager": {
+        "prefixes": ("OPRE", "MGMT", "BA", "STAT"),
+        "keywords": ("operations", "management", "supply chain", "logistics", "process", "optimization", "quality")
+    },
+    "investment analyst": {
+        "prefixes": ("FIN", "ECON", "ACCT", "STAT"),
+        "keywords": ("investment", "finance", "portfolio", "securities", "valuation", "financial markets", "risk")
+    },
+    "management consultant": {
+        "prefixes": ("MGMT", "BA", "ECON", "STAT"),
+        "keywords": ("management", "consulting", "strategy", "business", "analytics", "organizational", "leadership")
+    }
+})
+
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+
+def _canonical(text: str) -> str:
+    """Lower-case text with everything but letters and digits removed"""
+    return _NON_ALPHANUMERIC.sub("", text.lower())
+
+
+# Canonical career name -> CAREER_COURSE_MAPPINGS key, in declaration order
+CAREER_BY_CANONICAL = {_canonical(career): career for career in CAREER_COURSE_MAPPINGS}
+
+DEFAULT_COURSE_MAPPING = MappingProxyType({
+    "prefixes": ("BA", "STAT", "ECON"),
+    "keywords": ("business", "statistics", "economics")
+})
+
+
+def _alternation(terms: Iterable[str]) -> "re.Pattern[str]":
+    """Compile terms into a single substring-matching alternation"""
+    return re.compile("|".join(map(re.escape, terms)))
+
+
+# (prefix pattern, keyword pattern) per career, matched against lower-cased course fields
+CAREER_COURSE_PATTERNS = {
+    career: (_alternation(p.lower() for p in config["prefixes"]), _alternation(config["keywords"]))
+    for career, config in {**CAREER_COURSE_MAPPINGS, "default": DEFAULT_COURSE_MAPPING}.items()
+}
+GENERAL_COURSE_PATTERN = _alternation(['business', 'statistics', 'analysis', 'economics'])
+
+# Course explanations per career family, checked in order: (career terms,
+# ((course code terms, course title terms, template), ...), fallback template)
+EXPLANATION_RULES = (
+    # Financial Analyst explanations
+    (("financial analyst", "investment analyst"), (
+        (("fin",), ("finance",), "Essential finance course for {career_goal} - covers financial analysis and corporate finance principles."),
+        (("acct",), ("accounting",), "Critical accounting foundation for {career_goal} - essential for financial statement analysis."),
+        (("econ",), ("economics",), "Economic principles course for {career_goal} - provides market analysis foundation."),
+        (("stat",), ("statistics",), "Statistical analysis course for {career_goal} - essential for data-driven financial decisions."),
+    ), "Relevant business course for {career_goal} - builds analytical and business skills."),
+    # Neuroscientist/Neuro Scientist explanations
+    (("neuro", "neuroscience"), (
+        (("nsc",), ("neuroscience",), "Core neuroscience course for {career_goal} - fundamental for understanding brain function and neural systems."),
+        (("biol",), ("biology",), "Essential biology foundation for {career_goal} - provides understanding of cellular and molecular mechanisms."),
+        (("psyc",), ("psychology",), "Psychology course for {career_goal} - bridges understanding between brain and behavior."),
+        (("chem",), ("chemistry",), "Chemistry foundation for {career_goal} - essential for understanding molecular neuroscience."),
+        (("phys",), ("physics",), "Physics course for {career_goal} - important for understanding neural signaling and biophysics."),
+    ), "Relevant science course for {career_goal} - supports comprehensive understanding of neuroscience."),
+    # Data Scientist/Data Engineer explanations
+    (("data",), (
+        (("stat",), ("statistics",), "Critical statistics course for {career_goal} - essential for data analysis and modeling."),
+        (("cs",), ("programming", "software"), "Programming foundation for {career_goal} - key for data manipulation and algorithm implementation."),
+        (("ml",), ("machine learning",), "Machine learning course for {career_goal} - core competency for advanced data analysis."),
+        ((), ("database", "data"), "Data management course for {career_goal} - essential for working with large datasets."),
+    ), "Technical course for {career_goal} - builds analytical and computational skills."),
+    # Software/DevOps Engineer explanations
+    (("software", "devops", "engineer"), (
+        (("cs",), ("programming",), "Core programming course for {career_goal} - fundamental software development skills."),
+        ((), ("algorithm", "data structure"), "Essential algorithms course for {career_goal} - critical for efficient software design."),
+        ((), ("system", "cloud"), "Systems course for {career_goal} - important for infrastructure and deployment."),
+    ), "Technical course for {career_goal} - enhances software engineering capabilities."),
+    # Marketing Analyst explanations
+    (("marketing",), (
+        (("mktg",), ("marketing",), "Marketing course for {career_goal} - core marketing principles and strategies."),
+        (("stat",), ("analytics",), "Analytics course for {career_goal} - essential for data-driven marketing decisions."),
+        (("comm",), ("communication",), "Communication course for {career_goal} - important for effective marketing messaging."),
+    ), "Business course for {career_goal} - supports marketing strategy and analysis."),
+    # Business/Management roles
+    (("business", "management", "operations", "consultant"), (
+        (("mgmt",), ("management",), "Management course for {career_goal} - develops leadership and organizational skills."),
+        (("opre",), ("operations",), "Operations course for {career_goal} - essential for process improvement and efficiency."),
+        (("ba",), ("analytics",), "Business analytics course for {career_goal} - supports data-driven decision making."),
+        (("econ",), ("economics",), "Economics course for {career_goal} - provides market and business environment understanding."),
+    ), "Business course for {career_goal} - builds professional and analytical capabilities."),
+)
+
+# EXPLANATION_RULES with each term group compiled into one alternation (None when empty)
+_EXPLANATION_BUCKETS = tuple(
+    (
+        _alternation(career_terms),
+        tuple(
+            (code_terms and _alternation(code_terms), title_terms and _alternation(title_terms), template)
+            for code_terms, title_terms, template in rules
+        ),
+        default_template
+    )
+    for career_terms, rules, default_template in EXPLANATION_RULES
+)
+
+
+@lru_cache(maxsize=256)
+def _explanation_bucket(career_lower: str):
+    """(rules, fallback template) for the first career family matching the goal, or None"""
+    for career_re, rules, default_template in _EXPLANATION_BUCKETS:
+        if career_re.search(career_lower):
+            return rules, default_template
+    return None
+
+# Global instance, created on first access (PEP 562) so importing this module stays cheap
+_career_llm_service: Optional[CareerLLMService] = None
+
+
+def __getattr__(name: str) -> Any:
+    global _career_llm_service
+    if name == "career_llm_service":
+        if _career_llm_service is None:
+            _career_llm_service = CareerLLMService()
+        return _career_llm_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
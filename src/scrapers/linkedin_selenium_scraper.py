@@ -4,21 +4,130 @@ Based on the provided LinkedIn scraping logic
 """
 
 import asyncio
-import json
 import os
+import subprocess
+import tempfile
 import time
 import re
+import threading
 from datetime import datetime
 from typing import Dict, Any, List, Optional
+from urllib.parse import quote_plus, urlparse
+import orjson
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from src.config.config import AWSConfig
 
+# Locators the scraper waits on between navigation steps
+JOB_CARDS = (By.XPATH, '//li[@data-occludable-job-id]')
+JOB_TITLE = (By.XPATH, '//h1')
+
+# Cookies of the last logged-in LinkedIn session, reused to skip the login page
+LINKEDIN_COOKIES_FILE = "data/.linkedin_cookies.json"
+
+# Bundled chromedriver, looked up once per process; None means use the system one
+CHROMEDRIVER_PATH = next((path for path in (
+    "bin/chromedriver.exe",
+    "bin/chromedriver-win.exe",
+    "chromedriver.exe",
+    "chromedriver",
+) if os.path.exists(path)), None)
+
+
+# Common requirement patterns, compiled once
+REQUIREMENT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
+    r'degree\s*in\s*([^,\.]+)',
+    r'certification\s*in\s*([^,\.]+)',
+    r'proficiency\s*in\s*([^,\.]+)',
+    r'experience\s*with\s*([^,\.]+)',
+    r'knowledge\s*of\s*([^,\.]+)',
+    r'familiarity\s*with\s*([^,\.]+)',
+    r'strong\s*([^,\.]+)\s*skills',
+    r'expertise\s*in\s*([^,\.]+)'
+))
+
+# Common technical skills to look for
+SKILLS_KEYWORDS = (
+    'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git',
+    'sql', 'mongodb', 'postgresql', 'mysql', 'redis',
+    'machine learning', 'ai', 'data science', 'pandas', 'numpy',
+    'tensorflow', 'pytorch', 'scikit-learn', 'spark', 'hadoop',
+    'devops', 'ci/cd', 'terraform', 'ansible', 'linux', 'bash',
+    'agile', 'scrum', 'jira', 'confluence'
+)
+# Whole-word match of any skill, so "java" no longer matches inside "javascript"
+SKILLS_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, SKILLS_KEYWORDS)) + r')\b', re.IGNORECASE)
+
+# Job detail fields and the XPaths to try for each, in order of preference
+JOB_DETAIL_XPATHS = {
+    "title": ('//h1[contains(@class, "job-title")]', '//h1'),
+    "company": (
+        '//a[contains(@class, "job-details-jobs-unified-top-card__company-name")]',
+        '//span[contains(@class, "job-details-jobs-unified-top-card__company-name")]'
+    ),
+    "location": ('//span[contains(@class, "job-details-jobs-unified-top-card__bullet")]',),
+    "salary": ('//span[contains(@class, "job-details-jobs-unified-top-card__salary")]', '//span[contains(text(), "$")]'),
+    "description": (
+        '//div[contains(@class, "job-details-jobs-unified-top-card__job-description")]',
+        '//div[contains(@class, "jobs-description")]'
+    ),
+    "url": ('//a[contains(@href, "/jobs/view/")]',),
+    "posted_date": ('//span[contains(@class, "job-details-jobs-unified-top-card__posted-date")]',)
+}
+# Value used when none of a field's XPaths matched; fields not listed default to "N/A"
+JOB_DETAIL_DEFAULTS = {"salary": "Not specified"}
+JOB_INSIGHT_XPATH = '//span[contains(@class, "job-details-jobs-unified-top-card__job-insight")]'
+
+# Runs in the page: first matching node's text (href for "url") per field, or null,
+# plus every job insight's text and the current URL
+EXTRACT_JOB_DETAILS_JS = """
+const [fields, insightXPath] = arguments;
+const evaluate = (xpath, type) => document.evaluate(xpath, document, null, type, null);
+const text = (node) => (node.innerText || node.textContent || '').trim();
+const details = {current_url: window.location.href};
+for (const [name, xpaths] of Object.entries(fields)) {
+    details[name] = null;
+    for (const xpath of xpaths) {
+        const node = evaluate(xpath, XPathResult.FIRST_ORDERED_NODE_TYPE).singleNodeValue;
+        if (node) {
+            details[name] = name === 'url' ? node.href : text(node);
+            break;
+        }
+    }
+}
+const insights = evaluate(insightXPath, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE);
+details.job_types = [];
+for (let i = 0; i < insights.snapshotLength; i++) {
+    details.job_types.push(text(insights.snapshotItem(i)));
+}
+return details;
+"""
+
+# Runs in the page: the fields shown on every job card in the results list
+EXTRACT_JOB_CARDS_JS = """
+const text = (node) => node ? (node.innerText || node.textContent || '').trim() : null;
+return Array.from(document.querySelectorAll('li[data-occludable-job-id]'), (card) => ({
+    id: card.getAttribute('data-occludable-job-id'),
+    title: text(card.querySelector('.job-card-list__title')),
+    company: text(card.querySelector('.job-card-container__company-name')),
+    location: text(card.querySelector('.job-card-container__metadata-item')),
+    posted_date: text(card.querySelector('time')),
+    url: card.querySelector('a.job-card-list__title')?.href || null,
+}));
+"""
+
+def _logged_in(driver) -> bool:
+    """WebDriverWait condition: LinkedIn has redirected past the login page"""
+    current_url = driver.current_url
+    return "feed" in current_url or "mynetwork" in current_url or "jobs" in current_url
+
 
 class LinkedInSeleniumScraper:
     """
@@ -26,12 +135,22 @@ class LinkedInSeleniumScraper:
     Based on the provided scraping logic
     """
     
-    def __init__(self, manual_login_timeout=120):
-        """Initialize the LinkedIn scraper"""
+    def __init__(self, manual_login_timeout=120, headless=True):
+        """
+        Initialize the LinkedIn scraper
+        
+        Args:
+            manual_login_timeout: Seconds to wait for a manual login
+            headless: Run Chrome without a window. The main browser still opens a
+                window when there are no credentials, so you can log in manually.
+        """
         self.config = AWSConfig()
         self.driver = None
-        self.wait = None
+        self._wait_short = None  # 2 s WebDriverWait on the main driver, created with it
+        self._driver_headless = False  # whether the main driver has no window to log in through
+        self._scrape_lock = asyncio.Lock()  # one scrape at a time owns self.driver
         self.manual_login_timeout = manual_login_timeout  # Default 2 minutes
+        self.headless = headless
         
         # LinkedIn credentials (should be set in environment variables)
         self.linkedin_email = os.getenv("LINKEDIN_EMAIL", "")
@@ -41,68 +160,210 @@ class LinkedInSeleniumScraper:
         self.max_jobs = 50  # Reasonable limit for demo
         self.delay_between_requests = 2
         self.page_load_timeout = 10
+        self.browser_pool_size = 3  # Chrome drivers extracting job details in parallel
+        self.fetch_descriptions = True  # False reads the result cards only: much faster, but no description/skills
+    
+    def _create_driver(self, headless=True):
+        """Start a Chrome driver with anti-detection options"""
+        options = Options()
+        if headless:
+            # No window to paint; a small viewport keeps layout cheap
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=800,600")
+        else:
+            options.add_argument("--start-maximized")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-gpu")
         
-        # Ensure data directory exists
-        os.makedirs("data", exist_ok=True)
+        # The scraper never reads images, so don't download or decode them
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        
+        # Discard chromedriver's log instead of holding a log file handle per driver;
+        # without a bundled path Selenium finds the system chromedriver
+        service = Service(CHROMEDRIVER_PATH, log_output=subprocess.DEVNULL)
+        driver = webdriver.Chrome(service=service, options=options)
+        
+        # Set timeouts; no implicit wait, so a missing element fails fast and every
+        # wait is an explicit WebDriverWait
+        driver.implicitly_wait(0)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        return driver
     
     def _setup_driver(self):
         """Setup Chrome driver with anti-detection options"""
         try:
-            options = Options()
-            options.add_argument("--start-maximized")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-gpu")
-            
-            # Run in visible mode for manual login
-            # options.add_argument("--headless")  # Commented out to show browser window
-            print("🌐 Opening browser window for manual login...")
-            
-            # Try to find chromedriver
-            chromedriver_paths = [
-                "bin/chromedriver.exe",
-                "bin/chromedriver-win.exe", 
-                "chromedriver.exe",
-                "chromedriver"
-            ]
-            
-            driver_path = None
-            for path in chromedriver_paths:
-                if os.path.exists(path):
-                    driver_path = path
-                    break
-            
-            if driver_path:
-                self.driver = webdriver.Chrome(driver_path, options=options)
-            else:
-                # Try system chromedriver
-                self.driver = webdriver.Chrome(options=options)
-            
-            # Set timeouts
-            self.driver.implicitly_wait(10)
-            self.driver.set_page_load_timeout(self.page_load_timeout)
-            self.wait = WebDriverWait(self.driver, 10)
+            # A manual login needs a visible window. Credentials or a saved session may make it
+            # unnecessary; if they don't, _linkedin_login reopens the browser with a window.
+            can_login_unattended = bool(self.linkedin_email and self.linkedin_password) or os.path.exists(LINKEDIN_COOKIES_FILE)
+            headless = self.headless and can_login_unattended
+            if not headless:
+                print("🌐 Opening browser window for manual login...")
+            self._start_main_driver(headless)
             
             print("✅ Chrome driver initialized successfully")
             return True
-            
+        
         except Exception as e:
             print(f"❌ Error setting up Chrome driver: {e}")
             print("Chrome/chromedriver not available - will provide mock data instead")
             return False
     
+    def _start_main_driver(self, headless: bool) -> None:
+        """Start the main driver, replacing any one already running"""
+        if self.driver:
+            self._quit_driver(self.driver)
+            self.driver = None
+        self.driver = self._create_driver(headless)
+        self._driver_headless = headless
+        self._wait_short = WebDriverWait(self.driver, 2)
+    
+    def _create_session_driver(self, cookies: List[Dict[str, Any]]):
+        """
+        Start another Chrome driver signed in with the main driver's LinkedIn cookies
+        
+        Returns:
+            The driver, or None if Chrome could not be started or signed in
+        """
+        try:
+            driver = self._create_driver(self.headless)
+        except Exception as e:
+            print(f"⚠️ Could not start an extra Chrome driver: {e}")
+            return None
+        
+        try:
+            # Cookies can only be set for the domain currently loaded
+            driver.get("https://www.linkedin.com/")
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except Exception:
+                    continue
+        except Exception as e:
+            print(f"⚠️ Could not sign in an extra Chrome driver: {e}")
+            try:
+                self._quit_driver(driver)
+            except Exception:
+                pass
+            return None
+        return driver
+
+    @staticmethod
+    def _quit_driver(driver) -> None:
+        """Quit a driver, closing any pipes still open to its chromedriver process"""
+        process = getattr(driver.service, "process", None)
+        try:
+            for stream in (getattr(process, "stdout", None), getattr(process, "stderr", None)):
+                if stream:
+                    stream.close()
+        finally:
+            driver.quit()
+
+    def _wait_for(self, locator, timeout=5, driver=None):
+        """
+        Wait until an element is present instead of sleeping a fixed time
+        
+        Returns:
+            The element, or None if it did not appear within the timeout
+        """
+        try:
+            if driver is None and timeout == 2 and self._wait_short:
+                wait = self._wait_short
+            else:
+                wait = WebDriverWait(driver or self.driver, timeout)
+            return wait.until(EC.presence_of_element_located(locator))
+        except TimeoutException:
+            return None
+    
+    def _start_progress_reporter(self, interval=30) -> threading.Event:
+        """
+        Print the remaining manual-login time every `interval` seconds in the background
+        
+        Returns:
+            threading.Event: Set it to stop reporting
+        """
+        stop = threading.Event()
+        deadline = time.monotonic() + self.manual_login_timeout
+        
+        def report():
+            while not stop.wait(interval):
+                remaining = int(deadline - time.monotonic())
+                if remaining <= 0:
+                    return
+                print(f"⏰ Still waiting... {remaining // 60}m {remaining % 60}s remaining")
+        
+        threading.Thread(target=report, daemon=True).start()
+        return stop
+    
+    def _restore_session(self) -> bool:
+        """
+        Sign the driver in with the cookies saved by a previous login
+        
+        Returns:
+            True if LinkedIn accepted the saved session
+        """
+        if not os.path.exists(LINKEDIN_COOKIES_FILE):
+            return False
+        
+        try:
+            with open(LINKEDIN_COOKIES_FILE, 'rb') as f:
+                cookies = orjson.loads(f.read())
+            
+            # Cookies can only be set for the domain currently loaded
+            self.driver.get("https://www.linkedin.com/")
+            for cookie in cookies:
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    continue
+            self.driver.get("https://www.linkedin.com/feed/")
+            
+            # An expired session is redirected to the login page
+            if urlparse(self.driver.current_url).path.startswith("/feed"):
+                return True
+        except Exception as e:
+            print(f"⚠️ Could not restore saved LinkedIn session: {e}")
+        
+        # Don't retry a session LinkedIn no longer accepts
+        os.remove(LINKEDIN_COOKIES_FILE)
+        return False
+    
+    def _save_session(self) -> None:
+        """Save the driver's LinkedIn cookies so the next run can skip the login"""
+        try:
+            cookies_dir = os.path.dirname(LINKEDIN_COOKIES_FILE)
+            os.makedirs(cookies_dir, exist_ok=True)
+            
+            # The cookies are a live session: write an owner-only temp file (mkstemp's
+            # mode is 0600) and atomically swap it in, so a crash never leaves a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=cookies_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(orjson.dumps(self.driver.get_cookies()))
+                os.replace(tmp_path, LINKEDIN_COOKIES_FILE)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            print(f"⚠️ Could not save LinkedIn session: {e}")
+    
     def _linkedin_login(self) -> bool:
         """Login to LinkedIn with extended session for manual entry"""
+        if self._restore_session():
+            print("✅ Restored saved LinkedIn session")
+            return True
+        
         print("🔐 Opening LinkedIn login page...")
         print("📝 You can now manually enter your credentials in the browser window")
         print("⏰ Browser will stay open for 2 minutes to allow manual login")
         
         try:
             self.driver.get("https://www.linkedin.com/login")
-            time.sleep(3)
+            self._wait_for((By.ID, "username"))
             
             # If credentials are provided, try automatic login
             if self.linkedin_email and self.linkedin_password:
@@ -117,13 +378,16 @@ class LinkedInSeleniumScraper:
                     # Click login button
                     login_button = self.driver.find_element(By.XPATH, '//button[@type="submit"]')
                     login_button.click()
-                    time.sleep(5)
                     
                     # Check if login was successful
-                    if "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url:
+                    try:
+                        WebDriverWait(self.driver, 5).until(
+                            lambda driver: "feed" in driver.current_url or "mynetwork" in driver.current_url
+                        )
                         print("✅ LinkedIn automatic login successful")
+                        self._save_session()
                         return True
-                    else:
+                    except TimeoutException:
                         print("⚠️ Automatic login failed, please login manually")
                 except Exception as e:
                     print(f"⚠️ Automatic login failed: {e}")
@@ -131,26 +395,29 @@ class LinkedInSeleniumScraper:
             else:
                 print("📝 No credentials provided, please login manually")
             
+            # Nobody can log in to a headless browser, so reopen it with a window first
+            if self._driver_headless:
+                print("🌐 Saved session not accepted; opening browser window for manual login...")
+                self._start_main_driver(headless=False)
+                self.driver.get("https://www.linkedin.com/login")
+            
             # Wait for manual login with configurable timeout
             timeout_minutes = self.manual_login_timeout // 60
             print(f"⏰ Waiting for manual login ({timeout_minutes} minutes)...")
             print("💡 Please complete the login process in the browser window")
             
-            # Wait for manual login with configurable timeout
-            for i in range(self.manual_login_timeout):
-                time.sleep(1)
-                current_url = self.driver.current_url
-                
-                # Check if user has successfully logged in
-                if "feed" in current_url or "mynetwork" in current_url or "jobs" in current_url:
-                    print("✅ Manual login detected!")
-                    return True
-                
-                # Show progress every 30 seconds
-                if i % 30 == 0 and i > 0:
-                    remaining_minutes = (self.manual_login_timeout - i) // 60
-                    remaining_seconds = (self.manual_login_timeout - i) % 60
-                    print(f"⏰ Still waiting... {remaining_minutes}m {remaining_seconds}s remaining")
+            # Let Selenium poll for the post-login redirect; progress is reported
+            # from a background timer instead of from the wait loop
+            stop_progress = self._start_progress_reporter()
+            try:
+                WebDriverWait(self.driver, self.manual_login_timeout, poll_frequency=2.0).until(_logged_in)
+                print("✅ Manual login detected!")
+                self._save_session()
+                return True
+            except TimeoutException:
+                pass
+            finally:
+                stop_progress.set()
             
             print("⏰ Timeout reached. Continuing with current session...")
             return True  # Continue even if login status is unclear
@@ -160,43 +427,20 @@ class LinkedInSeleniumScraper:
             print("📝 Please ensure the browser window is accessible")
             return False
     
-    def _go_to_jobs_page(self) -> bool:
-        """Navigate to LinkedIn Jobs page"""
+    def _search_jobs(self, keyword: str, location: str = "") -> bool:
+        """Open the job search results for the given keyword and location"""
         try:
-            print("🔍 Navigating to LinkedIn Jobs...")
-            self.driver.get("https://www.linkedin.com/feed/")
-            time.sleep(3)
+            print(f"🔍 Searching for jobs: '{keyword}'" + (f" in '{location}'" if location else ""))
             
-            # Try to find and click the Jobs icon
-            try:
-                job_icon = self.driver.find_element(By.XPATH, '//li-icon[@type="job"]/ancestor::a')
-                job_icon.click()
-                time.sleep(3)
-                print("✅ Successfully navigated to Jobs page")
-                return True
-            except NoSuchElementException:
-                # Alternative: go directly to jobs URL
-                self.driver.get("https://www.linkedin.com/jobs/")
-                time.sleep(3)
-                print("✅ Navigated to Jobs page via direct URL")
-                return True
-                
-        except Exception as e:
-            print(f"❌ Error navigating to Jobs page: {e}")
-            return False
-    
-    def _search_jobs(self, keyword: str) -> bool:
-        """Search for jobs with the given keyword"""
-        try:
-            print(f"🔍 Searching for jobs: '{keyword}'")
+            # The search page takes its query from the URL, so there's no need to
+            # go through the feed and type into the search box
+            url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(keyword)}"
+            if location:
+                url += f"&location={quote_plus(location)}"
+            self.driver.get(url)
             
-            # Find search input
-            search_input = self.driver.find_element(By.XPATH, '//input[@aria-label="Search by title, skill, or company"]')
-            search_input.clear()
-            search_input.send_keys(keyword)
-            time.sleep(1)
-            search_input.send_keys(Keys.RETURN)
-            time.sleep(4)
+            # Wait for the result cards rather than a fixed delay
+            self._wait_for(JOB_CARDS, timeout=10)
             
             print("✅ Job search completed")
             return True
@@ -210,177 +454,117 @@ class LinkedInSeleniumScraper:
         try:
             # Click on the job to get details - optimized for speed
             self.driver.execute_script("arguments[0].scrollIntoView(true);", job_element)
+            job_id = job_element.get_attribute("data-occludable-job-id")
             job_element.click()
-            time.sleep(1.5)  # Reduced wait time for faster processing
-            
-            job_data = {}
             
-            # Extract job title
-            try:
-                title_element = self.driver.find_element(By.XPATH, '//h1[contains(@class, "job-title")]')
-                job_data['title'] = title_element.text.strip()
-            except NoSuchElementException:
+            # The details pane is loaded once the URL points at this job and it has a title;
+            # a short timeout keeps slow pages working with whatever has rendered
+            if job_id:
                 try:
-                    title_element = self.driver.find_element(By.XPATH, '//h1')
-                    job_data['title'] = title_element.text.strip()
-                except:
-                    job_data['title'] = "N/A"
-            
-            # Extract company name
-            try:
-                company_element = self.driver.find_element(By.XPATH, '//a[contains(@class, "job-details-jobs-unified-top-card__company-name")]')
-                job_data['company'] = company_element.text.strip()
-            except NoSuchElementException:
-                try:
-                    company_element = self.driver.find_element(By.XPATH, '//span[contains(@class, "job-details-jobs-unified-top-card__company-name")]')
-                    job_data['company'] = company_element.text.strip()
-                except:
-                    job_data['company'] = "N/A"
-            
-            # Extract location
-            try:
-                location_element = self.driver.find_element(By.XPATH, '//span[contains(@class, "job-details-jobs-unified-top-card__bullet")]')
-                job_data['location'] = location_element.text.strip()
-            except NoSuchElementException:
-                job_data['location'] = "N/A"
-            
-            # Extract salary information
-            try:
-                salary_elements = self.driver.find_elements(By.XPATH, '//span[contains(@class, "job-details-jobs-unified-top-card__salary")]')
-                if salary_elements:
-                    job_data['salary'] = salary_elements[0].text.strip()
-                else:
-                    # Try alternative salary selectors
-                    salary_elements = self.driver.find_elements(By.XPATH, '//span[contains(text(), "$")]')
-                    if salary_elements:
-                        job_data['salary'] = salary_elements[0].text.strip()
-                    else:
-                        job_data['salary'] = "Not specified"
-            except:
-                job_data['salary'] = "Not specified"
-            
-            # Extract job type and experience level
-            try:
-                job_type_elements = self.driver.find_elements(By.XPATH, '//span[contains(@class, "job-details-jobs-unified-top-card__job-insight")]')
-                job_types = [elem.text.strip() for elem in job_type_elements if elem.text.strip()]
-                job_data['job_types'] = job_types
-                
-                # Extract specific job type
-                for job_type in job_types:
-                    if any(keyword in job_type.lower() for keyword in ['full-time', 'part-time', 'contract', 'internship']):
-                        job_data['job_type'] = job_type
-                        break
-                else:
-                    job_data['job_type'] = "Full-time"  # Default
-                
-                # Extract experience level
-                for job_type in job_types:
-                    if any(keyword in job_type.lower() for keyword in ['entry', 'junior', 'mid', 'senior', 'lead', 'principal']):
-                        job_data['experience_level'] = job_type
-                        break
-                else:
-                    job_data['experience_level'] = "Mid-level"  # Default
-                    
-            except:
-                job_data['job_types'] = []
-                job_data['job_type'] = "Full-time"
-                job_data['experience_level'] = "Mid-level"
-            
-            # Extract job description
-            try:
-                desc_element = self.driver.find_element(By.XPATH, '//div[contains(@class, "job-details-jobs-unified-top-card__job-description")]')
-                job_data['description'] = desc_element.text.strip()
-            except NoSuchElementException:
-                try:
-                    desc_element = self.driver.find_element(By.XPATH, '//div[contains(@class, "jobs-description")]')
-                    job_data['description'] = desc_element.text.strip()
-                except:
-                    job_data['description'] = "N/A"
-            
-            # Extract requirements from description
-            job_data['requirements'] = self._extract_requirements_from_description(job_data.get('description', ''))
-            
-            # Extract job URL
-            try:
-                job_link_element = self.driver.find_element(By.XPATH, '//a[contains(@href, "/jobs/view/")]')
-                job_data['url'] = job_link_element.get_attribute("href")
-            except NoSuchElementException:
-                current_url = self.driver.current_url
-                if "/jobs/view/" in current_url:
-                    job_data['url'] = current_url
-                else:
-                    job_data['url'] = "N/A"
-            
-            # Extract posting date
-            try:
-                date_element = self.driver.find_element(By.XPATH, '//span[contains(@class, "job-details-jobs-unified-top-card__posted-date")]')
-                job_data['posted_date'] = date_element.text.strip()
-            except:
-                job_data['posted_date'] = "N/A"
-            
-            # Extract additional details
-            job_data['source'] = 'LinkedIn'
-            job_data['scraped_at'] = datetime.now().isoformat()
-            
-            # Extract skills from description
-            job_data['skills'] = self._extract_skills_from_description(job_data.get('description', ''))
-            
-            return job_data
+                    self._wait_short.until(EC.url_contains(f"currentJobId={job_id}"))
+                except TimeoutException:
+                    pass
+            self._wait_for(JOB_TITLE, timeout=2)
             
+            return self._read_job_details(self.driver)
+        
         except Exception as e:
             print(f"❌ Error extracting job data: {e}")
             return None
     
-    def _extract_requirements_from_description(self, description: str) -> List[str]:
-        """Extract job requirements from description"""
-        if not description or description == "N/A":
+    def _read_job_details(self, driver) -> Dict[str, Any]:
+        """Build job data from the job details currently shown in the driver"""
+        return self._parse_job_details(self._read_job_dom(driver))
+    
+    def _read_job_dom(self, driver) -> Dict[str, Any]:
+        """Raw job detail fields currently shown in the driver"""
+        # Read every field in one round-trip instead of one WebDriver call per lookup
+        return driver.execute_script(EXTRACT_JOB_DETAILS_JS, JOB_DETAIL_XPATHS, JOB_INSIGHT_XPATH)
+    
+    def _parse_job_details(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """Build job data from raw detail fields; pure Python, no browser calls"""
+        job_data = {}
+        job_data['title'] = self._detail_text(details, 'title')
+        job_data['company'] = self._detail_text(details, 'company')
+        job_data['location'] = self._detail_text(details, 'location')
+        job_data['salary'] = self._detail_text(details, 'salary')
+        
+        # Extract job type and experience level
+        job_types = [text for text in details['job_types'] if text]
+        job_data['job_types'] = job_types
+        
+        # Extract specific job type
+        for job_type in job_types:
+            if any(keyword in job_type.lower() for keyword in ['full-time', 'part-time', 'contract', 'internship']):
+                job_data['job_type'] = job_type
+                break
+        else:
+            job_data['job_type'] = "Full-time"  # Default
+        
+        # Extract experience level
+        for job_type in job_types:
+            if any(keyword in job_type.lower() for keyword in ['entry', 'junior', 'mid', 'senior', 'lead', 'principal']):
+                job_data['experience_level'] = job_type
+                break
+        else:
+            job_data['experience_level'] = "Mid-level"  # Default
+        
+        job_data['description'] = self._detail_text(details, 'description')
+        
+        # Lowercase the description once for both the requirement and skill scans
+        description = job_data['description']
+        description_lower = description.lower() if description != "N/A" else ""
+        
+        # Extract requirements from description
+        job_data['requirements'] = self._extract_requirements_from_description(description_lower)
+        
+        # Extract job URL
+        if details['url'] is not None:
+            job_data['url'] = details['url']
+        elif "/jobs/view/" in details['current_url']:
+            job_data['url'] = details['current_url']
+        else:
+            job_data['url'] = "N/A"
+        
+        job_data['posted_date'] = self._detail_text(details, 'posted_date')
+        
+        # Extract additional details
+        job_data['source'] = 'LinkedIn'
+        job_data['scraped_at'] = datetime.now().isoformat()
+        
+        # Extract skills from description
+        job_data['skills'] = self._extract_skills_from_description(description_lower)
+        
+        return job_data
+    
+    @staticmethod
+    def _detail_text(details: Dict[str, Any], field: str) -> str:
+        """A field read by EXTRACT_JOB_DETAILS_JS, or its default if nothing matched"""
+        value = details[field]
+        return value if value is not None else JOB_DETAIL_DEFAULTS.get(field, "N/A")
+    
+    def _extract_requirements_from_description(self, description_lower: str) -> List[str]:
+        """Extract job requirements from a lowercased description"""
+        if not description_lower:
             return []
         
         requirements = []
-        description_lower = description.lower()
-        
-        # Common requirement patterns
-        requirement_patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'degree\s*in\s*([^,\.]+)',
-            r'certification\s*in\s*([^,\.]+)',
-            r'proficiency\s*in\s*([^,\.]+)',
-            r'experience\s*with\s*([^,\.]+)',
-            r'knowledge\s*of\s*([^,\.]+)',
-            r'familiarity\s*with\s*([^,\.]+)',
-            r'strong\s*([^,\.]+)\s*skills',
-            r'expertise\s*in\s*([^,\.]+)'
-        ]
         
-        import re
-        for pattern in requirement_patterns:
-            matches = re.findall(pattern, description_lower, re.IGNORECASE)
-            requirements.extend(matches)
+        for pattern in REQUIREMENT_PATTERNS:
+            requirements.extend(pattern.findall(description_lower))
+            if len(requirements) >= 8:
+                break
         
         return requirements[:8]  # Limit to 8 requirements
     
-    def _extract_skills_from_description(self, description: str) -> List[str]:
-        """Extract skills from job description"""
-        if not description or description == "N/A":
+    def _extract_skills_from_description(self, description_lower: str) -> List[str]:
+        """Extract skills from a lowercased job description"""
+        if not description_lower:
             return []
         
-        # Common technical skills to look for
-        skills_keywords = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git',
-            'sql', 'mongodb', 'postgresql', 'mysql', 'redis',
-            'machine learning', 'ai', 'data science', 'pandas', 'numpy',
-            'tensorflow', 'pytorch', 'scikit-learn', 'spark', 'hadoop',
-            'devops', 'ci/cd', 'terraform', 'ansible', 'linux', 'bash',
-            'agile', 'scrum', 'jira', 'confluence'
-        ]
-        
-        found_skills = []
-        description_lower = description.lower()
-        
-        for skill in skills_keywords:
-            if skill in description_lower:
-                found_skills.append(skill.title())
+        # One pass over the description for all skills; report them in keyword order
+        found = set(SKILLS_RE.findall(description_lower))
+        found_skills = [skill.title() for skill in SKILLS_KEYWORDS if skill in found]
         
         return found_skills[:10]  # Limit to 10 skills
     
@@ -409,11 +593,6 @@ class LinkedInSeleniumScraper:
                     if job_data and job_data.get('title') != "N/A":
                         all_jobs.append(job_data)
                         print(f"  ✅ Collected {len(all_jobs)}/{max_jobs}: {job_data['title']} at {job_data['company']}")
-                        
-                        # Stop early if we have enough jobs
-                        if len(all_jobs) >= max_jobs:
-                            print(f"  🎯 Reached target of {max_jobs} jobs - stopping collection")
-                            break
                     else:
                         print(f"  ⚠️ Skipped job {i+1} (no valid data)")
                 
@@ -427,6 +606,97 @@ class LinkedInSeleniumScraper:
         print(f"\n✅ Optimized collection completed. Total jobs: {len(all_jobs)}")
         return all_jobs
     
+    def _collect_jobs_from_cards(self, max_jobs: int = 50) -> List[Dict[str, Any]]:
+        """
+        Collect job data from the result cards alone, without opening any job
+        
+        One in-page snapshot replaces a click and detail-pane load per job; fields
+        only shown in the details (description, salary, requirements, skills) are
+        left at their defaults.
+        """
+        cards = self.driver.execute_script(EXTRACT_JOB_CARDS_JS)[:max_jobs]
+        print(f"📋 Found {len(cards)} job cards; reading them from the results list...")
+        
+        jobs = []
+        for card in cards:
+            if not card['title']:
+                print(f"  ⚠️ Skipped job {card['id']} (no valid data)")
+                continue
+            
+            job_id = card['id']
+            jobs.append({
+                'title': card['title'],
+                'company': card['company'] or "N/A",
+                'location': card['location'] or "N/A",
+                'salary': "Not specified",
+                'job_types': [],
+                'job_type': "Full-time",  # Default
+                'experience_level': "Mid-level",  # Default
+                'description': "N/A",
+                'requirements': [],
+                'url': card['url'] or (f"https://www.linkedin.com/jobs/view/{job_id}/" if job_id else "N/A"),
+                'posted_date': card['posted_date'] or "N/A",
+                'source': 'LinkedIn',
+                'scraped_at': datetime.now().isoformat(),
+                'skills': []
+            })
+        
+        print(f"\n✅ Card collection completed. Total jobs: {len(jobs)}")
+        return jobs
+    
+    def _list_job_ids(self) -> List[str]:
+        """IDs of the job cards on the current results page, in order"""
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll('li[data-occludable-job-id]'),"
+            " card => card.getAttribute('data-occludable-job-id'));"
+        )
+    
+    def _extract_jobs_by_id(self, driver, job_ids: List[str]) -> List[Dict[str, Any]]:
+        """Open each job's own page in the given driver and extract its details"""
+        jobs = []
+        for job_id in job_ids:
+            try:
+                driver.get(f"https://www.linkedin.com/jobs/view/{job_id}/")
+                self._wait_for(JOB_TITLE, driver=driver)
+                job_data = self._read_job_details(driver)
+            except Exception as e:
+                print(f"  ❌ Error processing job {job_id}: {e}")
+                continue
+            
+            if job_data.get('title') != "N/A":
+                jobs.append(job_data)
+                print(f"  ✅ Collected: {job_data['title']} at {job_data['company']}")
+            else:
+                print(f"  ⚠️ Skipped job {job_id} (no valid data)")
+        return jobs
+    
+    async def _collect_jobs_parallel(self, max_jobs: int = 50) -> List[Dict[str, Any]]:
+        """
+        Collect job data by splitting the listed jobs across a pool of Chrome drivers
+        
+        The main driver lists the job IDs; it and the pooled drivers, all signed in
+        with the same cookies, then each open their share of job pages concurrently.
+        Jobs are returned in listing order.
+        """
+        job_ids = (await asyncio.to_thread(self._list_job_ids))[:max_jobs]
+        print(f"📋 Found {len(job_ids)} job cards; extracting with up to {self.browser_pool_size} browsers...")
+        if not job_ids:
+            return []
+        
+        async with ChromeDriverPool(self, self.browser_pool_size - 1) as pooled_drivers:
+            drivers = [self.driver] + pooled_drivers
+            shard_size = -(-len(job_ids) // len(drivers))  # ceiling division
+            shards = [job_ids[i:i + shard_size] for i in range(0, len(job_ids), shard_size)]
+            
+            results = await asyncio.gather(*(
+                asyncio.to_thread(self._extract_jobs_by_id, driver, shard)
+                for driver, shard in zip(drivers, shards)
+            ))
+        
+        all_jobs = [job for shard_jobs in results for job in shard_jobs]
+        print(f"\n✅ Parallel collection completed. Total jobs: {len(all_jobs)}")
+        return all_jobs
+
     def _get_mock_linkedin_jobs(self, job_title: str, location: str, max_jobs: int) -> List[Dict[str, Any]]:
         """Get mock LinkedIn job data when Chrome is not available"""
         print("📋 Providing mock LinkedIn job data...")
@@ -473,7 +743,19 @@ class LinkedInSeleniumScraper:
         return mock_jobs[:max_jobs]
 
     async def scrape_jobs(self, job_title: str, location: str = "", max_jobs: int = 50) -> List[Dict[str, Any]]:
-        """Main method to scrape LinkedIn jobs"""
+        """
+        Main method to scrape LinkedIn jobs
+        
+        Selenium calls block, so each browser step runs in a worker thread and
+        the event loop stays free for other requests while the scrape runs.
+        The driver lives on the scraper, so concurrent calls wait their turn
+        instead of sharing (and quitting) each other's browser.
+        """
+        async with self._scrape_lock:
+            return await self._scrape_jobs(job_title, location, max_jobs)
+    
+    async def _scrape_jobs(self, job_title: str, location: str, max_jobs: int) -> List[Dict[str, Any]]:
+        """Run one scrape; callers hold self._scrape_lock"""
         print(f"🚀 LinkedIn Job Scraper - Starting")
         print(f"Job Title: {job_title}")
         print(f"Location: {location or 'Any'}")
@@ -481,31 +763,30 @@ class LinkedInSeleniumScraper:
         print("=" * 50)
         
         # Setup driver
-        if not self._setup_driver():
+        if not await asyncio.to_thread(self._setup_driver):
             print("❌ Failed to setup driver - cannot scrape real data")
             return []
         
         try:
             # Login to LinkedIn
-            self._linkedin_login()
-            
-            # Navigate to jobs page
-            if not self._go_to_jobs_page():
-                print("❌ Failed to navigate to jobs page")
-                return []
+            await asyncio.to_thread(self._linkedin_login)
             
             # Search for jobs
-            search_term = f"{job_title} {location}".strip()
-            if not self._search_jobs(search_term):
+            if not await asyncio.to_thread(self._search_jobs, job_title, location):
                 print("❌ Failed to search for jobs")
                 return []
             
-            # Collect job data
-            jobs = self._collect_jobs_with_pagination(search_term, max_jobs)
+            # Collect job data, spreading detail pages over several browsers when enabled
+            if not self.fetch_descriptions:
+                jobs = await asyncio.to_thread(self._collect_jobs_from_cards, max_jobs)
+            elif self.browser_pool_size > 1:
+                jobs = await self._collect_jobs_parallel(max_jobs)
+            else:
+                jobs = await asyncio.to_thread(self._collect_jobs_with_pagination, job_title, max_jobs)
             
             # Save to cache
             if jobs:
-                self._save_jobs_to_cache(jobs, job_title, location)
+                await asyncio.to_thread(self._save_jobs_to_cache, jobs, job_title, location)
             
             return jobs
             
@@ -514,7 +795,9 @@ class LinkedInSeleniumScraper:
             return []
         finally:
             if self.driver:
-                self.driver.quit()
+                await asyncio.to_thread(self._quit_driver, self.driver)
+                self.driver = None
+                self._wait_short = None
                 print("Chrome driver closed.")
     
     def _save_jobs_to_cache(self, jobs: List[Dict[str, Any]], job_title: str, location: str) -> None:
@@ -533,8 +816,11 @@ class LinkedInSeleniumScraper:
         
         cache_file = f"data/linkedin_jobs_{job_title.replace(' ', '_').lower()}_{location.replace(' ', '_').lower() if location else 'any'}.json"
         
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2, ensure_ascii=False)
+        os.makedirs("data", exist_ok=True)
+        
+        # Compact orjson output: UTF-8 bytes written directly, about half the size of indented JSON
+        with open(cache_file, 'wb') as f:
+            f.write(orjson.dumps(cache_data))
         
         print(f"✅ Job data saved to {cache_file}")
         print(f"   Total jobs: {len(jobs)}")
@@ -564,6 +850,34 @@ class LinkedInSeleniumScraper:
         }
 
 
+class ChromeDriverPool:
+    """
+    Extra Chrome drivers sharing a scraper's logged-in LinkedIn session
+    
+    Usage:
+        async with ChromeDriverPool(scraper, 2) as drivers:
+            ...
+    """
+    
+    def __init__(self, scraper: LinkedInSeleniumScraper, size: int):
+        self.scraper = scraper
+        self.size = size
+        self.drivers = []
+    
+    async def __aenter__(self) -> List[Any]:
+        cookies = await asyncio.to_thread(self.scraper.driver.get_cookies)
+        drivers = await asyncio.gather(*(
+            asyncio.to_thread(self.scraper._create_session_driver, cookies) for _ in range(self.size)
+        ), return_exceptions=True)
+        # Keep every driver that started, so __aexit__ quits them all
+        self.drivers = [driver for driver in drivers if driver and not isinstance(driver, BaseException)]
+        return self.drivers
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await asyncio.gather(*(asyncio.to_thread(self.scraper._quit_driver, driver) for driver in self.drivers), return_exceptions=True)
+        self.drivers = []
+
+
 async def main():
     """Main function to run the scraper"""
     scraper = LinkedInSeleniumScraper()
@@ -5,22 +5,176 @@ Based on the coursebook-api scraping logic
 """
 
 import asyncio
-import json
+import atexit
 import os
+import queue
 import time
 import re
+import hashlib
+import sqlite3
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
+import orjson
+import requests
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, WebDriverException, InvalidSessionIdException
+)
 from src.core.aws.bedrock_service import BedrockService
 from src.config.config import AWSConfig
 
+# Coursebook elements the scraper waits on instead of sleeping after each page load
+COURSE_VALUE_CELLS = (By.CLASS_NAME, "courseinfo__overviewtable__td")
+COURSE_HEADER_CELLS = (By.CLASS_NAME, "courseinfo__overviewtable__th")
+SECTION_LINKS = (By.CLASS_NAME, "stopbubble")
+
+# Raw coursebook fields used by process_course_data, and their values when missing
+COURSE_FIELD_DEFAULTS = {
+    "course_number": "",
+    "course_title": "",
+    "description": "",
+    "enrollment_reqs": "",
+    "semester_credit_hours": "3",
+    "instructor": [],
+    "date/time": "",
+    "grading": "",
+    "mode": "",
+    "type": ""
+}
+COURSE_FIELDS = itemgetter(*COURSE_FIELD_DEFAULTS)
+COURSE_CODE_RE = re.compile(r"([a-z]+)(\d{4})")
+COURSE_CODE_PARTS_RE = re.compile(r"\s*([A-Za-z]+)\s*(\d)")  # department prefix, first digit of the number
+PREREQUISITES_RE = re.compile(r"prerequisite[s]?:?\s*([^.]+)", re.IGNORECASE)
+
+# Seconds a department's discovered course list stays fresh
+COURSE_DISCOVERY_MAX_AGE = 86400
+
+# Attempts per page fetch before a transient network or browser error is given up on
+FETCH_ATTEMPTS = 3
+
+# Seconds a Chrome page load may take before it counts as a (retried) timeout
+PAGE_LOAD_TIMEOUT = 20
+
+# Warm Chrome drivers parked between scraping runs in this process
+DRIVER_POOL_SIZE = 4
+_DRIVER_POOL = queue.Queue(maxsize=DRIVER_POOL_SIZE)
+
+# Chrome profiles under data/ keep each driver's HTTP cache warm across runs.
+# A profile can only be open in one browser at a time, so each live driver holds its own slot.
+CHROME_PROFILE_DIR = "data/chrome_profile_{}"
+CHROME_DISK_CACHE_BYTES = 100 * 1024 * 1024
+_profile_slots_in_use = set()
+_profile_slots_lock = threading.Lock()
+
+# Requests Chrome drivers never make: only the page text is scraped
+BLOCKED_URL_PATTERNS = ("*.css", "*.woff", "*.woff2", "*.ttf", "*.otf")
+
+# Course descriptions sent to Bedrock per skill-extraction call
+SKILL_BATCH_SIZE = 20
+
+# Upper bound on skill-extraction calls in flight, to stay under the Bedrock request quota
+MAX_CONCURRENT_SKILL_BATCHES = 8
+
+# Skills recognized without Bedrock in descriptions of at most KEYWORD_ONLY_MAX_WORDS words.
+# Single letters (C, R) are left out: "a grade of C or better" is common in course text.
+KEYWORD_ONLY_MAX_WORDS = 60
+COURSE_SKILL_KEYWORDS = (
+    "Python", "Java", "C++", "C#", "JavaScript", "TypeScript", "SQL", "MATLAB",
+    "HTML", "CSS", "React", "Node.js", "AWS", "Azure", "Docker", "Kubernetes",
+    "Linux", "Unix", "Git", "TensorFlow", "PyTorch", "Machine Learning",
+    "Deep Learning", "Artificial Intelligence", "Data Structures", "Algorithms",
+    "Databases", "Operating Systems", "Computer Networks", "Computer Architecture",
+    "Cybersecurity", "Cryptography", "Software Engineering", "Object-Oriented Programming",
+    "Data Analysis", "Data Mining", "Statistics", "Probability", "Linear Algebra",
+    "Calculus", "Discrete Mathematics", "Excel"
+)
+# Whole-term match of any keyword; "+" and "#" count as word characters so C++ and C# match exactly
+COURSE_SKILLS_RE = re.compile(
+    r"(?<![\w+#])(?:" + "|".join(map(re.escape, sorted(COURSE_SKILL_KEYWORDS, key=len, reverse=True))) + r")(?![\w+#])",
+    re.IGNORECASE
+)
+
+# Headers for fetching static coursebook pages without a browser
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept-Encoding": "gzip",
+}
+
+
+def _take_profile_slot() -> int:
+    """Reserve the lowest Chrome profile slot no live driver is using"""
+    with _profile_slots_lock:
+        slot = next(i for i in range(len(_profile_slots_in_use) + 1) if i not in _profile_slots_in_use)
+        _profile_slots_in_use.add(slot)
+        return slot
+
+
+def _free_profile_slot(slot) -> None:
+    """Let another driver open this Chrome profile slot"""
+    with _profile_slots_lock:
+        _profile_slots_in_use.discard(slot)
+
+
+def _quit_driver(driver) -> None:
+    """Quit a Chrome driver, ignoring one that is already gone, and free its profile slot"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    _free_profile_slot(getattr(driver, "profile_slot", None))
+
+
+def _take_pooled_driver():
+    """A live driver from the pool, or None if the pool is empty"""
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            return None
+        try:
+            driver.current_url  # raises if the browser has gone away
+            return driver
+        except Exception:
+            _quit_driver(driver)
+
+
+@atexit.register
+def close_driver_pool() -> None:
+    """Quit every parked Chrome driver"""
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            return
+        _quit_driver(driver)
+
+
+def _with_retries(call, retriable, attempts=FETCH_ATTEMPTS):
+    """Run call(), retrying the given transient errors with exponential backoff"""
+    for attempt in range(attempts):
+        try:
+            return call()
+        except NoSuchElementException:
+            raise  # a missing element means missing data, not a flaky network
+        except retriable as e:
+            if attempt == attempts - 1:
+                raise
+            delay = min(0.5 * 2 ** attempt, 5)
+            print(f"Transient error ({type(e).__name__}); retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
 
 class UTDCourseSeleniumScraper:
     """
@@ -28,19 +182,27 @@ class UTDCourseSeleniumScraper:
     Uses the actual scraping logic from coursebook-api
     """
     
-    def __init__(self):
-        """Initialize the UTD Course Selenium scraper"""
+    def __init__(self, max_age: float = 172800):
+        """
+        Initialize the UTD Course Selenium scraper
+        
+        Args:
+            max_age: Seconds a cached coursebook page stays fresh (default 48 hours)
+        """
         self.config = AWSConfig()
         self.bedrock_service = BedrockService()
         self.cache_file = "data/utd_courses.json"
         
         # Ensure data directory exists
         os.makedirs("data", exist_ok=True)
+        self.page_cache = CourseCache(max_age=max_age)
         
         # Target departments for scraping
         self.target_departments = self.config.target_departments
+        # Each department once, in order, with its interned lower-case course code prefix
+        self._dept_prefixes = {dept: sys.intern(dept.lower()) for dept in self.target_departments}
         
-        # Common course numbers to scrape for each department
+        # Known course numbers per department, used when a department's courses can't be discovered
         self.course_numbers = {
             "CS": ["1336", "1337", "2336", "3345", "4347", "4348", "4352", "4353", "4354", "4355", "4356", "4357", "4358", "4359", "4361", "4365", "4366", "4367", "4368", "4369", "4370"],
             "SE": ["4351", "4352", "4353", "4354", "4355", "4356", "4357", "4358", "4359", "4360", "4361", "4362", "4363", "4364", "4365", "4366", "4367", "4368", "4369", "4370"],
@@ -50,12 +212,45 @@ class UTDCourseSeleniumScraper:
             "SYSM": ["4351", "4352", "4353", "4354", "4355", "4356", "4357", "4358", "4359", "4360", "4361", "4362", "4363", "4364", "4365", "4366", "4367", "4368", "4369", "4370"]
         }
         
-        # Initialize Chrome driver
-        self.driver = None
-        self._setup_driver()
+        # Chrome drivers, one per scraping thread, taken from the pool or created on first use
+        self.max_browsers = DRIVER_POOL_SIZE
+        self._local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+        self._driver_failed = False
+        self._driver_started = False
+        self._dept_counts = Counter()  # Courses per department from the last scrape_courses
     
-    def _setup_driver(self):
-        """Setup Chrome driver with options"""
+    @property
+    def driver(self):
+        """This thread's Chrome driver, reused or started on first use; None if Chrome is unavailable"""
+        driver = getattr(self._local, "driver", None)
+        if driver is None and not self._driver_failed:
+            driver = _take_pooled_driver() or self._create_driver()
+            if driver is None:
+                # Give up on Chrome only if it never started; after that a failed
+                # start is transient and the next page tries again
+                if not self._driver_started:
+                    self._driver_failed = True  # don't retry Chrome for every course
+            else:
+                self._driver_started = True
+                self._local.driver = driver
+                with self._drivers_lock:
+                    self._drivers.append(driver)
+        return driver
+    
+    @property
+    def session(self) -> requests.Session:
+        """This thread's HTTP session for static coursebook pages, reusing its connections"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(HTTP_HEADERS)
+            self._local.session = session
+        return session
+    
+    def _create_driver(self):
+        """Start a Chrome driver with options"""
         try:
             chrome_options = Options()
             chrome_options.add_argument("--disable-gpu")
@@ -65,6 +260,23 @@ class UTDCourseSeleniumScraper:
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
             
+            # Only the page text is read: skip rendering a window and loading images
+            # (stylesheets and fonts are blocked below), and return from get() once
+            # the DOM is ready
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2
+            })
+            chrome_options.page_load_strategy = "eager"
+            
+            # Keep the browser's HTTP cache in a persistent profile so warm runs skip static assets
+            profile_slot = _take_profile_slot()
+            profile_dir = os.path.abspath(CHROME_PROFILE_DIR.format(profile_slot))
+            os.makedirs(profile_dir, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+            chrome_options.add_argument(f"--disk-cache-size={CHROME_DISK_CACHE_BYTES}")
+            
             # Try to find chromedriver
             chromedriver_paths = [
                 "bin/chromedriver.exe",
@@ -79,45 +291,126 @@ class UTDCourseSeleniumScraper:
                     driver_path = path
                     break
             
-            if driver_path:
-                self.driver = webdriver.Chrome(driver_path, options=chrome_options)
-            else:
-                # Try system chromedriver
-                self.driver = webdriver.Chrome(options=chrome_options)
+            try:
+                # Selenium 4 takes the driver path through a Service; without a bundled
+                # path it finds the system chromedriver
+                driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+            except Exception:
+                _free_profile_slot(profile_slot)
+                raise
+            driver.profile_slot = profile_slot
             
-            # Navigate to coursebook
-            self.driver.get("https://coursebook.utdallas.edu")
-            print("✅ Chrome driver initialized successfully")
+            # Chrome has no content setting for stylesheets or fonts; block their
+            # requests through the DevTools protocol instead
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+            except Exception:
+                _quit_driver(driver)
+                raise
             
+            # Bound every page load, so a hung page costs one timeout per retry
+            # instead of Selenium's 300 s default
+            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+            
+            print("✅ Chrome driver initialized successfully")
+            return driver
+        
         except Exception as e:
             print(f"❌ Error setting up Chrome driver: {e}")
             print("Please ensure Chrome and chromedriver are installed")
-            self.driver = None
+            return None
+    
+    def _release_drivers(self) -> None:
+        """Park the scraping threads' Chrome drivers in the shared pool, quitting any that don't fit"""
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                # Reset so the next run starts from a clean session
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+                _DRIVER_POOL.put_nowait(driver)
+            except Exception:
+                _quit_driver(driver)
+        self._local = threading.local()
+        if drivers:
+            print(f"Released {len(drivers)} Chrome driver(s) to the pool.")
     
-    def _set_inject_vars(self):
-        """Extract course data from the page (based on coursebook-api logic)"""
+    def _load_page(self, url) -> bool:
+        """
+        Open a URL in this thread's driver, retrying transient browser errors
+        
+        Returns:
+            False if the page says it was not found
+        """
+        def load():
+            driver = self.driver
+            if driver is None:
+                raise WebDriverException("Chrome driver is unavailable")
+            try:
+                driver.get(url)
+            except InvalidSessionIdException:
+                self._discard_driver(driver)
+                raise
+            except TimeoutException:
+                raise
+            except WebDriverException:
+                # Retrying on a crashed browser can't succeed; start the next attempt on a fresh one
+                if not self._driver_alive(driver):
+                    self._discard_driver(driver)
+                raise
+        
+        _with_retries(load, (TimeoutException, WebDriverException))
+        return "not found" not in self.driver.title.lower()
+    
+    @staticmethod
+    def _driver_alive(driver) -> bool:
+        """Whether the driver's browser session still answers"""
         try:
-            course_elements = self.driver.find_elements(By.CLASS_NAME, "courseinfo__overviewtable__td")
-            course_head_elements = self.driver.find_elements(By.CLASS_NAME, "courseinfo__overviewtable__th")
-            
-            return {
-                "course": course_elements,
-                "course_head": course_head_elements
-            }
-        except Exception as e:
-            print(f"Error extracting course data: {e}")
-            return {"course": [], "course_head": []}
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    def _discard_driver(self, driver) -> None:
+        """Quit this thread's dead driver so the next self.driver starts a fresh Chrome"""
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        self._local.driver = None
+        _quit_driver(driver)
     
-    def _scrape_course_data(self, course_elements, course_head_elements):
-        """Scrape course data from elements (based on coursebook-api logic)"""
+    def _wait_for(self, locator, timeout=10) -> bool:
+        """
+        Wait until an element is present instead of sleeping a fixed time
+        
+        Returns:
+            True if the element appeared within the timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
+            return True
+        except TimeoutException:
+            return False
+    
+    def _extract_fields(self, html) -> Dict[str, Any]:
+        """Course data from a section page's HTML, parsed locally in one pass"""
+        soup = BeautifulSoup(html, "html.parser")
+        course_head_texts = [cell.get_text(" ", strip=True) for cell in soup.find_all(class_=COURSE_HEADER_CELLS[1])]
+        course_texts = [cell.get_text(" ", strip=True) for cell in soup.find_all(class_=COURSE_VALUE_CELLS[1])]
+        return self._scrape_course_data(course_texts, course_head_texts)
+    
+    def _scrape_course_data(self, course_texts, course_head_texts):
+        """Scrape course data from the table's cell texts (based on coursebook-api logic)"""
         try:
             course_data = {}
             
             # Extract course information
-            for i, head in enumerate(course_head_elements):
-                if i < len(course_elements):
-                    key = head.text.strip().lower().replace(" ", "_")
-                    value = course_elements[i].text.strip()
+            for i, head in enumerate(course_head_texts):
+                if i < len(course_texts):
+                    key = head.strip().lower().replace(" ", "_")
+                    value = course_texts[i].strip()
                     course_data[key] = value
             
             return course_data
@@ -130,55 +423,106 @@ class UTDCourseSeleniumScraper:
         """Scrape a single course section (based on coursebook-api logic)"""
         try:
             url = f"https://coursebook.utdallas.edu/clips/clip-coursebook.zog?id={course_tag}&action=info"
-            self.driver.get(url)
+            cached = self.page_cache.get_page(url)
+            if cached is not None:
+                return cached
             
-            # Wait for page to load
-            time.sleep(2)
+            # The section page is static HTML, so try a plain HTTP fetch before a browser
+            course_data = self._fetch_section_over_http(url)
+            if course_data:
+                self.page_cache.put_page(url, course_data)
+                time.sleep(0.2)  # Rate limiting
+                return course_data
             
-            # Extract course data
-            inject_vars = self._set_inject_vars()
-            course_data = self._scrape_course_data(inject_vars["course"], inject_vars["course_head"])
+            if not self.driver or not self._load_page(url):
+                return {}
             
-            return course_data
+            # Wait for the course table rather than a fixed delay
+            if not self._wait_for(COURSE_HEADER_CELLS):
+                print(f"Course table for {course_tag} did not load")
+                return {}
             
+            # Read the page once and parse it locally; the value cells can render just after the headers
+            course_data = self._extract_fields(self.driver.page_source)
+            if not course_data:
+                time.sleep(1)
+                course_data = self._extract_fields(self.driver.page_source)
+            
+            if course_data:
+                self.page_cache.put_page(url, course_data)
+            time.sleep(0.2)  # Rate limiting
+            return course_data
+        
         except Exception as e:
             print(f"Error scraping course {course_tag}: {e}")
             return {}
     
+    def _fetch_section_over_http(self, url) -> Dict[str, Any]:
+        """
+        Course data parsed from a section page fetched without a browser
+        
+        Returns:
+            The course data, or {} if the fetch failed or the page holds no course
+            table (so the caller can fall back to Selenium)
+        """
+        try:
+            response = _with_retries(
+                lambda: self.session.get(url, timeout=10), (requests.ConnectionError, requests.Timeout)
+            )
+            response.raise_for_status()  # an HTTP error status is an answer, not retried
+        except requests.RequestException as e:
+            print(f"HTTP fetch failed for {url}: {e}")
+            return {}
+        
+        return self._extract_fields(response.content)
+    
+    def _find_course_sections(self, url, course_tag):
+        """Section tags listed on a course's search page, or None if there are none"""
+        if not self.driver or not self._load_page(url):
+            print(f"No sections found for {course_tag}")
+            return None
+        
+        # Wait for the section list rather than a fixed delay
+        if not self._wait_for(SECTION_LINKS):
+            print(f"No sections found for {course_tag}")
+            return None
+        
+        try:
+            course_list = self.driver.find_elements(*SECTION_LINKS)
+            current_term_element = self.driver.find_element(By.CLASS_NAME, "directaddress")
+            current_term = current_term_element.text[-3:]  # Get last 3 characters
+        except NoSuchElementException:
+            print(f"No sections found for {course_tag}")
+            return None
+        
+        course_sections = []
+        for course in course_list:
+            section_text = course.text.replace(' ', '').lower()
+            course_sections.append(f"{section_text}.{current_term}")
+        
+        time.sleep(1)  # Rate limiting
+        return course_sections
+    
     def _webscrape_all_sections(self, course_tag):
         """Scrape all sections for a course (based on coursebook-api logic)"""
         try:
             url = f"https://coursebook.utdallas.edu/search/{course_tag}"
-            self.driver.get(url)
+            course_sections = self.page_cache.get_page(url)
+            if course_sections is None:
+                course_sections = self._find_course_sections(url, course_tag)
+                if not course_sections:
+                    return []
+                self.page_cache.put_page(url, course_sections)
             
-            # Wait for page to load
-            time.sleep(2)
+            # Scrape each section
+            all_sections = []
+            for section in course_sections:
+                section_data = self._webscrape_single_section(section)
+                if section_data:
+                    all_sections.append(section_data)
             
-            # Find course sections
-            try:
-                course_list = self.driver.find_elements(By.CLASS_NAME, "stopbubble")
-                current_term_element = self.driver.find_element(By.CLASS_NAME, "directaddress")
-                current_term = current_term_element.text[-3:]  # Get last 3 characters
-                
-                course_sections = []
-                for course in course_list:
-                    section_text = course.text.replace(' ', '').lower()
-                    course_sections.append(f"{section_text}.{current_term}")
-                
-                # Scrape each section
-                all_sections = []
-                for section in course_sections:
-                    section_data = self._webscrape_single_section(section)
-                    if section_data:
-                        all_sections.append(section_data)
-                    time.sleep(0.2)  # Rate limiting
-                
-                return all_sections
-                
-            except NoSuchElementException:
-                print(f"No sections found for {course_tag}")
-                return []
-                
+            return all_sections
+        
         except Exception as e:
             print(f"Error scraping all sections for {course_tag}: {e}")
             return []
@@ -188,6 +532,16 @@ class UTDCourseSeleniumScraper:
         if not description or len(description.strip()) < 10:
             return []
         
+        # Short descriptions naming known skills don't need the model
+        keyword_skills = self._keyword_skills(description)
+        if keyword_skills is not None:
+            return keyword_skills
+        
+        # Bedrock calls are the slowest step, so reuse skills for an unchanged description
+        cached = self.page_cache.get_skills(description)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = f"""
             Analyze this course description and extract the main technical skills, programming languages, tools, and technologies mentioned.
@@ -198,47 +552,139 @@ class UTDCourseSeleniumScraper:
             Skills:"""
             
             response = self.bedrock_service.invoke_model(prompt)
-            if response and "skills:" in response.lower():
-                skills_text = response.split("skills:")[-1].strip()
-                skills = [skill.strip() for skill in skills_text.split(",") if skill.strip()]
-                return skills[:10]  # Limit to 10 skills
-            return []
+            skills_text = response.get("content", "")
+            if "skills:" in skills_text.lower():
+                skills_text = skills_text[skills_text.lower().rindex("skills:") + len("skills:"):]
+            skills = [skill.strip() for skill in skills_text.split(",") if skill.strip()][:10]  # Limit to 10 skills
+            
+            self.page_cache.put_skills(description, skills)
+            return skills
             
         except Exception as e:
             print(f"Error extracting skills: {e}")
             return []
     
+    @staticmethod
+    def _keyword_skills(description: str) -> Optional[List[str]]:
+        """
+        Skills named in a short description, matched against COURSE_SKILL_KEYWORDS
+        
+        Returns:
+            The skills in vocabulary order, or None when the description is too
+            long for keywords to be enough or names no known skill
+        """
+        if len(description.split()) > KEYWORD_ONLY_MAX_WORDS:
+            return None
+        found = {match.group(0).lower() for match in COURSE_SKILLS_RE.finditer(description)}
+        if not found:
+            return None
+        return [skill for skill in COURSE_SKILL_KEYWORDS if skill.lower() in found][:10]  # Limit to 10 skills
+    
+    async def _extract_all_skills(self, courses: List[Dict[str, Any]]) -> None:
+        """
+        Fill in the skills of every course, extracting them in batched Bedrock calls
+        
+        Short descriptions naming known skills are matched locally and cached
+        descriptions are reused; the rest are sent SKILL_BATCH_SIZE at a time,
+        one prompt per batch returning a JSON array of skill lists, with up to
+        MAX_CONCURRENT_SKILL_BATCHES batches running concurrently.
+        """
+        pending = {}
+        for course in courses:
+            description = course.get("description", "")
+            if not description or len(description.strip()) < 10:
+                continue
+            keyword_skills = self._keyword_skills(description)
+            if keyword_skills is not None:
+                course["skills"] = keyword_skills
+                continue
+            cached = self.page_cache.get_skills(description)
+            if cached is not None:
+                course["skills"] = cached
+            else:
+                pending.setdefault(description, []).append(course)
+        
+        if not pending:
+            return
+        
+        descriptions = list(pending)
+        batches = [descriptions[i:i + SKILL_BATCH_SIZE] for i in range(0, len(descriptions), SKILL_BATCH_SIZE)]
+        print(f"Extracting skills for {len(descriptions)} course descriptions in {len(batches)} Bedrock call(s)...")
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SKILL_BATCHES)
+        results = await asyncio.gather(
+            *(self._extract_skills_batch(batch, semaphore) for batch in batches), return_exceptions=True
+        )
+        for batch, batch_skills in zip(batches, results):
+            if isinstance(batch_skills, Exception):
+                print(f"Error extracting skills for a batch of {len(batch)} courses: {batch_skills}")
+                continue
+            for description, skills in zip(batch, batch_skills):
+                if skills is None:
+                    continue
+                self.page_cache.put_skills(description, skills)
+                for course in pending[description]:
+                    course["skills"] = skills
+    
+    async def _extract_skills_batch(self, descriptions: List[str], semaphore: asyncio.Semaphore) -> List[Optional[List[str]]]:
+        """Skills for each description from one Bedrock call; None entries if the response could not be used"""
+        numbered = "\n".join(f"{i}. {description}" for i, description in enumerate(descriptions, 1))
+        prompt = f"""
+            Analyze each numbered course description below and extract the main technical skills, programming languages, tools, and technologies mentioned.
+            Return only a JSON array with one element per description, in order, where element i is the list of skill strings for description i. No explanations.
+            
+            {numbered}"""
+        
+        try:
+            async with semaphore:
+                response = await self.bedrock_service.invoke_model_async(
+                    prompt, max_tokens=200 * len(descriptions), temperature=0.0
+                )
+            content = response.get("content", "")
+            skills_lists = orjson.loads(content[content.index("["):content.rindex("]") + 1])
+        except Exception as e:
+            print(f"Error extracting skills for a batch of {len(descriptions)} courses: {e}")
+            return [None] * len(descriptions)
+        
+        if not isinstance(skills_lists, list) or len(skills_lists) != len(descriptions):
+            print(f"Skill batch returned {len(skills_lists) if isinstance(skills_lists, list) else 'no'} results for {len(descriptions)} courses")
+            return [None] * len(descriptions)
+        
+        return [
+            [str(skill).strip() for skill in skills if str(skill).strip()][:10] if isinstance(skills, list) else None  # Limit to 10 skills
+            for skills in skills_lists
+        ]
+    
     def process_course_data(self, course_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process raw course data into our standardized format"""
         if not course_data:
             return {}
         
-        # Extract basic information
-        course_code = course_data.get("course_number", "")
-        course_title = course_data.get("course_title", "")
-        description = course_data.get("description", "")
-        
-        # Extract skills from description
-        skills = self.extract_skills_from_description(description)
+        # Extract basic information, in one lookup over the defaulted fields
+        (course_code, course_title, description, enrollment_reqs, credit_hours,
+         instructors, schedule, grading, mode, course_type) = COURSE_FIELDS({**COURSE_FIELD_DEFAULTS, **course_data})
         
         # Extract prerequisites
         prerequisites = []
-        enrollment_reqs = course_data.get("enrollment_reqs", "")
         if enrollment_reqs:
-            prereq_match = re.search(r"prerequisite[s]?:?\s*([^.]+)", enrollment_reqs.lower())
+            prereq_match = PREREQUISITES_RE.search(enrollment_reqs)
             if prereq_match:
-                prereq_text = prereq_match.group(1)
+                prereq_text = prereq_match.group(1).lower()
                 prerequisites = [req.strip() for req in prereq_text.split(",") if req.strip()]
         
         # Extract credit hours
-        credit_hours = course_data.get("semester_credit_hours", "3")
-        try:
-            credits = int(credit_hours)
-        except:
-            credits = 3
+        credits = int(credit_hours) if isinstance(credit_hours, str) and credit_hours.isdecimal() else 3
+        
+        # Department prefix and level (5000+ is graduate) from a code like "cs1336" or "MATH 2413"
+        code_match = COURSE_CODE_PARTS_RE.match(course_code)
+        if code_match:
+            department = code_match.group(1).upper()
+            level = "graduate" if code_match.group(2) >= "5" else "undergraduate"
+        else:
+            department = course_code[:2].upper() if len(course_code) > 2 else "CS"
+            level = "undergraduate"
         
         # Extract instructor information
-        instructors = course_data.get("instructor", [])
         if isinstance(instructors, str):
             instructors = [instructors] if instructors else []
         
@@ -249,73 +695,145 @@ class UTDCourseSeleniumScraper:
             "credits": credits,
             "prerequisites": prerequisites,
             "corequisites": [],
-            "department": course_code[:2].upper() if len(course_code) > 2 else "CS",
-            "skills": skills,
+            "department": department,
+            "skills": [],  # Filled in by _extract_all_skills once every course is scraped
             "instructors": instructors,
-            "level": "undergraduate" if int(course_code[2:]) < 5000 else "graduate",
-            "schedule": course_data.get("date/time", ""),
-            "grading": course_data.get("grading", ""),
-            "mode": course_data.get("mode", ""),
-            "type": course_data.get("type", "")
+            "level": level,
+            "schedule": schedule,
+            "grading": grading,
+            "mode": mode,
+            "type": course_type
         }
     
+    def _discover_course_numbers(self, dept: str) -> List[str]:
+        """
+        Course numbers a department offers, read from its coursebook search page
+        
+        Discovery is cached for a day. Falls back to the known numbers in
+        self.course_numbers when the search page can't be read.
+        """
+        prefix = self._dept_prefixes[dept]
+        url = f"https://coursebook.utdallas.edu/search/{prefix}"
+        numbers = self.page_cache.get_page(url, max_age=COURSE_DISCOVERY_MAX_AGE)
+        if numbers is not None:
+            return numbers
+        
+        numbers = []
+        if self.driver:
+            try:
+                if self._load_page(url) and self._wait_for(SECTION_LINKS):
+                    # Section names look like "CS 1336.001"; keep each course number once, in page order
+                    found = {}
+                    for section in self.driver.find_elements(*SECTION_LINKS):
+                        match = COURSE_CODE_RE.match(section.text.replace(' ', '').lower())
+                        if match and match.group(1) == prefix:
+                            found[match.group(2)] = None
+                    numbers = list(found)
+            except Exception as e:
+                print(f"Error discovering courses for {dept}: {e}")
+        
+        if not numbers:
+            print(f"Could not discover {dept} courses; using the known course numbers")
+            return self.course_numbers.get(dept, [])
+        
+        print(f"Discovered {len(numbers)} {dept} courses")
+        self.page_cache.put_page(url, numbers)
+        return numbers
+    
+    def _build_crawl_plan(self, course_numbers: List[List[str]]) -> List[Tuple[int, str]]:
+        """
+        Flatten the discovered course numbers, aligned with self._dept_prefixes,
+        into one (position, course code) list, building every code once up front
+        """
+        course_codes = [
+            f"{prefix}{course_num}"
+            for prefix, numbers in zip(self._dept_prefixes.values(), course_numbers)
+            for course_num in numbers
+        ]
+        return list(enumerate(course_codes, 1))
+    
+    def _scrape_one_course(self, course_code: str, position: int, total: int) -> Dict[str, Any]:
+        """
+        Scrape and process one course on this thread's driver; {} if nothing was found
+        
+        Cached pages are used without starting a browser.
+        """
+        print(f"  [{position}/{total}] Processing {course_code}...")
+        
+        try:
+            # Scrape all sections for this course
+            sections_data = self._webscrape_all_sections(course_code)
+            
+            processed_course = {}
+            if sections_data:
+                # Process the first section (they should all be similar)
+                processed_course = self.process_course_data(sections_data[0])
+                
+                if processed_course and processed_course.get('course_code'):
+                    print(f"    ✅ {processed_course['course_code']}: {processed_course['title']}")
+                else:
+                    print(f"    ⚠️ No valid data for {course_code}")
+            else:
+                print(f"    ❌ No sections found for {course_code}")
+            
+            return processed_course
+        
+        except Exception as e:
+            print(f"    ❌ Error processing {course_code}: {e}")
+            return {}
+    
     async def scrape_courses(self) -> List[Dict[str, Any]]:
-        """Scrape all courses using Selenium"""
-        if not self.driver:
-            print("❌ Chrome driver not initialized")
-            return []
+        """
+        Scrape all courses using Selenium
         
+        Courses are independent pages, so they are spread over a pool of threads,
+        each driving its own Chrome; results keep the department/course order.
+        """
         print("Starting UTD course scraping with Selenium...")
         print(f"Target departments: {self.target_departments}")
         
+        loop = asyncio.get_running_loop()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_browsers) as pool:
+                # Crawl only the courses each department actually offers
+                course_numbers = await asyncio.gather(*(
+                    loop.run_in_executor(pool, self._discover_course_numbers, dept)
+                    for dept in self._dept_prefixes
+                ))
+                crawl_plan = self._build_crawl_plan(course_numbers)
+                total_courses = len(crawl_plan)
+                print(f"Scraping {total_courses} courses with up to {self.max_browsers} browsers...")
+                
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(pool, self._scrape_one_course, course_code, position, total_courses)
+                    for position, course_code in crawl_plan
+                ), return_exceptions=True)
+        finally:
+            self._release_drivers()
+        
+        # Keep the scraped courses, counting them per department for the summary
         all_courses = []
-        total_courses = sum(len(courses) for courses in self.course_numbers.values())
-        processed = 0
+        self._dept_counts = Counter()
+        for course in results:
+            if isinstance(course, dict) and course.get('course_code'):
+                all_courses.append(course)
+                self._dept_counts[course['department']] += 1
+        if not all_courses and self._driver_failed:
+            print("❌ Chrome driver not initialized")
+            return []
         
-        for dept in self.target_departments:
-            if dept not in self.course_numbers:
-                continue
-                
-            print(f"Processing {dept} department...")
-            
-            for course_num in self.course_numbers[dept]:
-                course_code = f"{dept.lower()}{course_num}"
-                processed += 1
-                
-                print(f"  [{processed}/{total_courses}] Processing {course_code}...")
-                
-                try:
-                    # Scrape all sections for this course
-                    sections_data = self._webscrape_all_sections(course_code)
-                    
-                    if sections_data:
-                        # Process the first section (they should all be similar)
-                        processed_course = self.process_course_data(sections_data[0])
-                        
-                        if processed_course and processed_course.get('course_code'):
-                            all_courses.append(processed_course)
-                            print(f"    ✅ {processed_course['course_code']}: {processed_course['title']}")
-                        else:
-                            print(f"    ⚠️ No valid data for {course_code}")
-                    else:
-                        print(f"    ❌ No sections found for {course_code}")
-                    
-                    # Rate limiting
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"    ❌ Error processing {course_code}: {e}")
-                    continue
+        await self._extract_all_skills(all_courses)
         
         print(f"Scraping completed. Found {len(all_courses)} courses.")
         return all_courses
     
     def save_courses_to_json(self, courses: List[Dict[str, Any]]) -> None:
         """Save courses to JSON file"""
+        total_courses = len(courses)
         data = {
             "metadata": {
                 "scraped_at": datetime.now().isoformat(),
-                "total_courses": len(courses),
+                "total_courses": total_courses,
                 "departments": self.target_departments,
                 "version": "3.0",
                 "source": "UTD Coursebook Selenium Scraper"
@@ -323,40 +841,31 @@ class UTDCourseSeleniumScraper:
             "courses": courses
         }
         
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 bytes directly, far faster than json's pretty-printer
+        with open(self.cache_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         print(f"✅ Course data saved to {self.cache_file}")
-        print(f"   Total courses: {len(courses)}")
+        print(f"   Total courses: {total_courses}")
         print(f"   Departments: {', '.join(self.target_departments)}")
     
     async def run_scraping(self) -> None:
         """Run the complete scraping process"""
         try:
-            if not self.driver:
-                print("❌ Chrome driver not available. Please install Chrome and chromedriver.")
-                return
-            
-            # Scrape courses
+            # Scrape courses; scrape_courses returns its drivers to the pool when done
             courses = await self.scrape_courses()
             
             if courses:
                 # Save to JSON
                 self.save_courses_to_json(courses)
                 
-                # Print summary
+                # Print summary; scrape_courses already counted courses by department
                 print("\n" + "="*50)
                 print("SCRAPING SUMMARY")
                 print("="*50)
                 print(f"Total courses scraped: {len(courses)}")
                 
-                # Count by department
-                dept_counts = {}
-                for course in courses:
-                    dept = course.get('department', 'Unknown')
-                    dept_counts[dept] = dept_counts.get(dept, 0) + 1
-                
-                for dept, count in dept_counts.items():
+                for dept, count in self._dept_counts.most_common():
                     print(f"{dept}: {count} courses")
                 
                 print(f"\nData saved to: {self.cache_file}")
@@ -367,10 +876,67 @@ class UTDCourseSeleniumScraper:
                 
         except Exception as e:
             print(f"❌ Scraping failed: {e}")
+        
         finally:
-            if self.driver:
-                self.driver.quit()
-                print("Chrome driver closed.")
+            self.page_cache.close()
+
+
+class CourseCache:
+    """
+    SQLite cache of parsed coursebook pages and AI-extracted course skills
+    
+    Pages expire after max_age seconds; skills are keyed by a hash of the
+    description, so they stay valid until the description changes.
+    """
+    
+    def __init__(self, path: str = "data/utd_course_cache.sqlite3", max_age: float = 172800):
+        self.max_age = max_age
+        self._lock = threading.Lock()  # one connection shared by the scraping threads
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, fetched_at REAL, parsed_json TEXT)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS skills (description_sha1 TEXT PRIMARY KEY, skills_json TEXT)")
+    
+    def get_page(self, url: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Parsed data stored for a URL, or None if missing or older than max_age (default: the cache's)"""
+        with self._lock:
+            row = self._conn.execute("SELECT fetched_at, parsed_json FROM pages WHERE url = ?", (url,)).fetchone()
+        if row is None or time.time() - row[0] >= (self.max_age if max_age is None else max_age):
+            return None
+        return orjson.loads(row[1])
+    
+    def put_page(self, url: str, parsed: Any) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?)", (url, time.time(), self._dumps(parsed))
+            )
+    
+    def get_skills(self, description: str) -> Optional[List[str]]:
+        """Skills stored for a description, or None if it hasn't been analyzed"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT skills_json FROM skills WHERE description_sha1 = ?", (self._description_key(description),)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+    
+    def put_skills(self, description: str, skills: List[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO skills VALUES (?, ?)", (self._description_key(description), self._dumps(skills))
+            )
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+    
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    @staticmethod
+    def _description_key(description: str) -> str:
+        return hashlib.sha1(description.encode("utf-8")).hexdigest()
 
 
 async def main():
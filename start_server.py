@@ -3,23 +3,21 @@
 Start script for the UTD Career Guidance AI System
 """
 
+import importlib.util
 import os
 import sys
 
 def check_dependencies():
-    """Check if all required dependencies are installed"""
-    try:
-        import fastapi
-        import uvicorn
-        import boto3
-        import selenium
-        import pandas
-        print("✅ All dependencies found")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    """Check if all required dependencies are installed, without importing them"""
+    required = ("fastapi", "uvicorn", "boto3", "selenium", "pandas")
+    missing = [package for package in required if importlib.util.find_spec(package) is None]
+    if missing:
+        print(f"❌ Missing dependencies: {', '.join(missing)}")
         print("Please run: pip install -r requirements.txt")
         return False
+    
+    print("✅ All dependencies found")
+    return True
 
 def check_aws_credentials():
     """Check if AWS credentials are configured"""
@@ -61,8 +59,17 @@ def main():
     print("🔄 Starting server with auto-reload...")
     print()
     
-    # Start uvicorn
-    os.system("uvicorn src.api.app:app --reload --host 127.0.0.1 --port 8000")
+    # Start uvicorn in this process instead of through a shell, on uvloop/httptools
+    # where installed ("auto" falls back to asyncio/h11, e.g. on Windows)
+    import uvicorn
+    uvicorn.run(
+        "src.api.app:app",
+        host="127.0.0.1",
+        port=8000,
+        reload=True,
+        loop="auto",
+        http="auto"
+    )
 
 if __name__ == "__main__":
     main()